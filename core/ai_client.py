@@ -529,6 +529,10 @@ When the user wants to continue a search, include a "continue_search" field in y
 
         Args:
             context: Dictionary with keys 'user_query', 'last_results', 'history', 'round'.
+                'history' may be a list of past rounds or an already-serialized JSON
+                string; strings are embedded in the prompt as-is, so callers running
+                many rounds can append to a cached serialization instead of
+                re-encoding the whole history each round.
 
         Returns:
             dict: The AI's next file search command, e.g.:
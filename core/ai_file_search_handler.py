@@ -4,11 +4,16 @@ Handles integration between the AI client and file search system.
 """
 
 import json
-from typing import Dict, Any, Optional
+import logging
+import threading
+import time
+from typing import Dict, Any, List, Optional
 
 # Use the prioritized search implementation
 from core.prioritized_search_adapter import prioritized_search
 
+logger = logging.getLogger(__name__)
+
 class AIFileSearchHandler:
     """
     Handles file search requests from the AI client and returns formatted results.
@@ -35,14 +40,14 @@ class AIFileSearchHandler:
         Returns:
             Dictionary with results and status
         """
-        print(f"DEBUG: handle_request called with action={action}, kwargs={kwargs}")
+        logger.debug("handle_request called with action=%s, kwargs=%s", action, kwargs)
         try:
             if action == "process_query":
                 query = kwargs.get("query", "")
                 if not query:
                     return {"success": False, "error": "No query provided"}
                 
-                print(f"DEBUG: Processing query: {query}")
+                logger.debug("Processing query: %s", query)
                 return self.file_search.process_query(query)
                 
             elif action == "list_folders":
@@ -50,7 +55,7 @@ class AIFileSearchHandler:
                 if not directory:
                     return {"success": False, "error": "No directory provided"}
                 
-                print(f"DEBUG: Listing folders in: {directory}")
+                logger.debug("Listing folders in: %s", directory)
                 folders = self.file_search.list_folders(directory)
                 return {
                     "success": True,
@@ -65,7 +70,7 @@ class AIFileSearchHandler:
                 if not directory:
                     return {"success": False, "error": "No directory provided"}
                 
-                print(f"DEBUG: Listing files in: {directory} with pattern: {pattern}")
+                logger.debug("Listing files in: %s with pattern: %s", directory, pattern)
                 files = self.file_search.list_files(directory, pattern)
                 return {
                     "success": True,
@@ -81,9 +86,9 @@ class AIFileSearchHandler:
                 if not directory:
                     return {"success": False, "error": "No directory provided"}
                 
-                print(f"DEBUG: Searching files recursively in: {directory} with pattern: {pattern}")
+                logger.debug("Searching files recursively in: %s with pattern: %s", directory, pattern)
                 files = self.file_search.search_files_recursive(directory, pattern)
-                print(f"DEBUG: Found {len(files)} files matching pattern")
+                logger.debug("Found %d files matching pattern", len(files))
                 return {
                     "success": True,
                     "directory": directory,
@@ -120,9 +125,7 @@ class AIFileSearchHandler:
                 return {"success": False, "error": f"Unknown action: {action}"}
                 
         except Exception as e:
-            import traceback
-            print(f"DEBUG: Exception in handle_request: {str(e)}")
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.exception("Exception in handle_request: %s", e)
             return {"success": False, "error": str(e)}
     
     def process_ai_command(self, command: Dict[str, Any], timeout: int = 5) -> Dict[str, Any]:
@@ -136,9 +139,7 @@ class AIFileSearchHandler:
         Returns:
             Dictionary with results and status
         """
-        print(f"DEBUG: process_ai_command called with command={command}, timeout={timeout}")
-        import threading
-        import time
+        logger.debug("process_ai_command called with command=%s, timeout=%s", command, timeout)
         
         try:
             if not isinstance(command, dict):
@@ -146,21 +147,21 @@ class AIFileSearchHandler:
                 if isinstance(command, str):
                     try:
                         command = json.loads(command)
-                        print(f"DEBUG: Parsed command from JSON string: {command}")
+                        logger.debug("Parsed command from JSON string: %s", command)
                     except:
-                        print("DEBUG: Failed to parse command as JSON")
+                        logger.debug("Failed to parse command as JSON")
                         return {"success": False, "error": "Invalid command format"}
                 else:
-                    print(f"DEBUG: Command is not a dict or string: {type(command)}")
+                    logger.debug("Command is not a dict or string: %s", type(command))
                     return {"success": False, "error": "Command must be a dictionary or JSON string"}
             
             # Get the action from the command
             action = command.get("action")
             if not action:
-                print("DEBUG: No action specified in command")
+                logger.debug("No action specified in command")
                 return {"success": False, "error": "No action specified"}
             
-            print(f"DEBUG: Action from command: {action}")
+            logger.debug("Action from command: %s", action)
             
             # Map the AI command actions to handler actions
             action_mapping = {
@@ -174,26 +175,26 @@ class AIFileSearchHandler:
             }
             
             handler_action = action_mapping.get(action, action)
-            print(f"DEBUG: Mapped action to handler action: {action} -> {handler_action}")
+            logger.debug("Mapped action to handler action: %s -> %s", action, handler_action)
             
             # Remove action from kwargs
             kwargs = {k: v for k, v in command.items() if k != "action" and k != "continue_search" and k != "extended_search"}
-            print(f"DEBUG: Kwargs after removing action and control fields: {kwargs}")
+            logger.debug("Kwargs after removing action and control fields: %s", kwargs)
             
             # Special case for natural language queries
             if handler_action == "process_query" and "query" not in kwargs:
                 if "text" in kwargs:
                     kwargs["query"] = kwargs.pop("text")
-                    print(f"DEBUG: Using 'text' as query: {kwargs['query']}")
+                    logger.debug("Using 'text' as query: %s", kwargs["query"])
                 elif "message" in kwargs:
                     kwargs["query"] = kwargs.pop("message")
-                    print(f"DEBUG: Using 'message' as query: {kwargs['query']}")
+                    logger.debug("Using 'message' as query: %s", kwargs["query"])
                 elif "pattern" in kwargs and "directory" in kwargs:
                     # Convert file-pattern-directory to a query
                     pattern = kwargs.pop("pattern")
                     directory = kwargs.pop("directory")
                     kwargs["query"] = f"Find files matching {pattern} in {directory}"
-                    print(f"DEBUG: Created query from pattern and directory: {kwargs['query']}")
+                    logger.debug("Created query from pattern and directory: %s", kwargs["query"])
             
             # Execute the search with the specified timeout
             result = self._search_with_timeout(handler_action, kwargs, timeout)
@@ -211,9 +212,7 @@ class AIFileSearchHandler:
             return result
                 
         except Exception as e:
-            import traceback
-            print(f"DEBUG: Exception in process_ai_command: {str(e)}")
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.exception("Exception in process_ai_command: %s", e)
             return {"success": False, "error": str(e)}
     
     def continue_search(self, original_command: Dict[str, Any]) -> Dict[str, Any]:
@@ -227,7 +226,7 @@ class AIFileSearchHandler:
         Returns:
             Dictionary with search results
         """
-        print(f"DEBUG: Continuing search with command: {original_command}")
+        logger.debug("Continuing search with command: %s", original_command)
         
         try:
             # Extract the action and parameters from the original command
@@ -251,7 +250,7 @@ class AIFileSearchHandler:
             
             # Use a longer timeout for the extended search
             extended_timeout = 30  # 30 seconds for extended search
-            print(f"DEBUG: Starting extended search with {extended_timeout}s timeout")
+            logger.debug("Starting extended search with %ss timeout", extended_timeout)
             
             # Perform the extended search
             result = self._search_with_timeout(handler_action, kwargs, extended_timeout)
@@ -261,9 +260,7 @@ class AIFileSearchHandler:
             return result
             
         except Exception as e:
-            import traceback
-            print(f"DEBUG: Exception in continue_search: {str(e)}")
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.exception("Exception in continue_search: %s", e)
             return {"success": False, "error": str(e)}
     
     def _search_with_timeout(self, action: str, kwargs: Dict[str, Any], timeout: int) -> Dict[str, Any]:
@@ -278,10 +275,7 @@ class AIFileSearchHandler:
         Returns:
             Dictionary with search results or timeout indication
         """
-        import threading
-        import time
-        
-        print(f"DEBUG: _search_with_timeout called with action={action}, timeout={timeout}")
+        logger.debug("_search_with_timeout called with action=%s, timeout=%s", action, timeout)
         
         # Default result in case of timeout
         result = {
@@ -299,17 +293,14 @@ class AIFileSearchHandler:
             nonlocal result, search_complete
             try:
                 result = self.handle_request(action, **kwargs)
-                search_complete = True
             except Exception as e:
-                import traceback
-                print(f"DEBUG: Search worker exception: {e}")
-                print(f"DEBUG: {traceback.format_exc()}")
+                logger.exception("Search worker exception: %s", e)
                 result = {"success": False, "error": f"Search error: {str(e)}"}
-                search_complete = True
+            search_complete = True
         
-        # Start search in background thread
-        search_thread = threading.Thread(target=search_worker)
-        search_thread.daemon = True
+        # Each search gets its own daemon thread: a search that outlives its timeout
+        # can't hold up later searches, and a hung walk doesn't keep the app alive
+        search_thread = threading.Thread(target=search_worker, daemon=True)
         start_time = time.time()
         search_thread.start()
         
@@ -317,9 +308,9 @@ class AIFileSearchHandler:
         search_thread.join(timeout)
         
         if not search_complete:
-            print(f"DEBUG: Search operation timed out after {timeout} seconds")
+            logger.debug("Search operation timed out after %s seconds", timeout)
         else:
-            print(f"DEBUG: Search completed in {time.time() - start_time:.2f} seconds")
+            logger.debug("Search completed in %.2f seconds", time.time() - start_time)
             
         return result
     
@@ -336,7 +327,58 @@ class AIFileSearchHandler:
         try:
             # Process the query
             result = self.file_search.process_query(query)
+        except Exception as e:
+            return f"Error searching for files: {e}"
+        return self._format_search_response(query, result)
+    
+    def natural_language_search_batch(self, queries: List[str]) -> List[str]:
+        """
+        Perform several natural language searches in one call.
+        
+        The searches run concurrently, one daemon thread per query, since each one is
+        dominated by waiting on the file system, and the responses are formatted once
+        every search has finished.
+        
+        Args:
+            queries: Natural language query strings
+            
+        Returns:
+            Human-readable response strings, in the same order as the queries
+        """
+        results: List[Any] = [None] * len(queries)
+        
+        def search(index: int, query: str) -> None:
+            try:
+                results[index] = self.file_search.process_query(query)
+            except Exception as e:
+                results[index] = e
+        
+        threads = [
+            threading.Thread(target=search, args=(index, query), daemon=True)
+            for index, query in enumerate(queries)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [
+            f"Error searching for files: {result}" if isinstance(result, Exception)
+            else self._format_search_response(query, result)
+            for query, result in zip(queries, results)
+        ]
+    
+    def _format_search_response(self, query: str, result: Dict[str, Any]) -> str:
+        """
+        Turn a search result into a human-readable response.
+        
+        Args:
+            query: The natural language query that was searched
+            result: Result dictionary from process_query
             
+        Returns:
+            Human-readable response string
+        """
+        try:
             # If using AI client and it's available, let it format the response
             if self.ai_client:
                 try:
@@ -346,12 +388,12 @@ class AIFileSearchHandler:
                         "count": result.get("count", 0),
                         "parameters": result.get("parsed_params", {})
                     }
-                    print(f"Context: {context}")
+                    logger.debug("Context: %s", context)
                     return self.ai_client.get_response(
                         f"Format these file search results as a helpful response: {json.dumps(context)}"
                     )
                 except Exception as e:
-                    print(f"AI client error: {e}")
+                    logger.error("AI client error: %s", e)
                     # Fall back to default formatting
             
             # Default formatting
@@ -8,6 +8,8 @@ import re
 import datetime
 from typing import List, Dict, Any, Optional, Union
 
+from core import fs_ops
+
 class EverythingSearch:
     """
     A wrapper class for the Everything SDK that provides advanced file search capabilities.
@@ -138,6 +140,8 @@ class EverythingSearch:
         results = []
         search_path = path or os.path.expanduser("~")
         query_regex = re.compile(query, re.IGNORECASE) if query else None
+        # Lowered once here rather than for every file in the walk
+        file_type_lower = file_type.lower() if file_type else None
         
         try:
             count = 0
@@ -146,22 +150,26 @@ class EverythingSearch:
                 if count >= limit:
                     break
                 
+                # Joined once per directory; os.path.join only adds the separator when
+                # root doesn't already end with one (e.g. a drive root)
+                root_prefix = os.path.join(root, "")
+                
                 # Process files in this directory
                 for file in files:
                     # Check if we've reached the limit
                     if count >= limit:
                         break
                     
-                    # Check if file matches query
-                    if query_regex and not query_regex.search(file):
+                    # Check file type if specified (cheaper than the query regex, so first)
+                    if file_type_lower and not file.lower().endswith(file_type_lower):
                         continue
                     
-                    # Check file type if specified
-                    if file_type and not file.lower().endswith(file_type.lower()):
+                    # Check if file matches query
+                    if query_regex and not query_regex.search(file):
                         continue
                     
                     # Get file details
-                    file_path = os.path.join(root, file)
+                    file_path = root_prefix + file
                     try:
                         stat = os.stat(file_path)
                         date_modified = datetime.datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -244,7 +252,7 @@ class EverythingSearch:
         """
         if not self.available:
             try:
-                return [f for f in os.listdir(directory) if os.path.isdir(os.path.join(directory, f))]
+                return fs_ops.list_folders(directory)
             except Exception as e:
                 print(f"Error listing folders: {e}")
                 return []
@@ -255,7 +263,7 @@ class EverythingSearch:
         except Exception as e:
             print(f"Error listing folders: {e}")
             try:
-                return [f for f in os.listdir(directory) if os.path.isdir(os.path.join(directory, f))]
+                return fs_ops.list_folders(directory)
             except Exception:
                 return []
     
@@ -271,10 +279,8 @@ class EverythingSearch:
             List of file names
         """
         if not self.available:
-            import fnmatch
             try:
-                return [f for f in os.listdir(directory) 
-                        if os.path.isfile(os.path.join(directory, f)) and fnmatch.fnmatch(f, pattern)]
+                return fs_ops.list_files(directory, pattern)
             except Exception as e:
                 print(f"Error listing files: {e}")
                 return []
@@ -286,10 +292,8 @@ class EverythingSearch:
             return [os.path.basename(item.path) for item in self.es.results()]
         except Exception as e:
             print(f"Error listing files: {e}")
-            import fnmatch
             try:
-                return [f for f in os.listdir(directory) 
-                        if os.path.isfile(os.path.join(directory, f)) and fnmatch.fnmatch(f, pattern)]
+                return fs_ops.list_files(directory, pattern)
             except Exception:
                 return []
     
@@ -305,13 +309,11 @@ class EverythingSearch:
             List of file paths
         """
         if not self.available:
-            matches = []
-            import fnmatch
             try:
-                for root, dirs, files in os.walk(directory):
-                    for filename in fnmatch.filter(files, pattern):
-                        matches.append(os.path.join(root, filename))
-                return matches
+                pattern_regex = fs_ops.compile_glob(pattern)
+                return [os.path.join(root, filename)
+                        for root, dirs, files in os.walk(directory)
+                        for filename in files if pattern_regex.match(filename)]
             except Exception as e:
                 print(f"Error searching files: {e}")
                 return []
@@ -323,13 +325,11 @@ class EverythingSearch:
             return [item.path for item in self.es.results()]
         except Exception as e:
             print(f"Error searching files: {e}")
-            matches = []
-            import fnmatch
             try:
-                for root, dirs, files in os.walk(directory):
-                    for filename in fnmatch.filter(files, pattern):
-                        matches.append(os.path.join(root, filename))
-                return matches
+                pattern_regex = fs_ops.compile_glob(pattern)
+                return [os.path.join(root, filename)
+                        for root, dirs, files in os.walk(directory)
+                        for filename in files if pattern_regex.match(filename)]
             except Exception:
                 return []
     
@@ -6,11 +6,23 @@ This module translates natural language queries into Everything search parameter
 import os
 import re
 import json
+from bisect import bisect_right
 from typing import Dict, List, Any, Optional, Union
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Import the Everything search engine
 from core.everything_search import search_engine
+from core import query_parser
+
+# Size bucket upper bounds and the (divisor, template) used to render each bucket
+_SIZE_THRESHOLDS = (1024, 1024**2, 1024**3)
+_SIZE_FORMATS = (
+    (1, "{} B"),
+    (1024, "{:.1f} KB"),
+    (1024**2, "{:.1f} MB"),
+    (1024**3, "{:.1f} GB"),
+)
+
 
 class FileSearchAdapter:
     """
@@ -68,96 +80,8 @@ class FileSearchAdapter:
         Returns:
             Dictionary of search parameters
         """
-        params = {
-            "query": "",
-            "path": None,
-            "file_type": None,
-            "min_size": None,
-            "max_size": None,
-            "modified_after": None,
-            "modified_before": None,
-            "limit": 50
-        }
-        
-        # Extract file types
-        file_type_match = re.search(r'\.([a-zA-Z0-9]+)\b|\bfiles?\s+of\s+type\s+([a-zA-Z0-9]+)|\b([a-zA-Z0-9]+)\s+files?\b', query, re.IGNORECASE)
-        if file_type_match:
-            ext = file_type_match.group(1) or file_type_match.group(2) or file_type_match.group(3)
-            if ext:
-                params["file_type"] = ext.lower()
-                # Remove the file type from the query for cleaner keyword search
-                query = re.sub(r'\.([a-zA-Z0-9]+)\b|\bfiles?\s+of\s+type\s+([a-zA-Z0-9]+)|\b([a-zA-Z0-9]+)\s+files?\b', '', query, flags=re.IGNORECASE)
-        
-        # Extract paths - look for "in [path]" pattern
-        path_match = re.search(r'\bin\s+([\'"]?)([a-zA-Z]:\\[^"\']+|~[^"\']*|\/[^"\']+)(\1)', query, re.IGNORECASE)
-        if path_match:
-            path = path_match.group(2)
-            # Handle home directory
-            if path.startswith('~'):
-                path = os.path.expanduser(path)
-            params["path"] = path
-            # Remove the path from the query for cleaner keyword search
-            query = re.sub(r'\bin\s+([\'"]?)([a-zA-Z]:\\[^"\']+|~[^"\']*|\/[^"\']+)(\1)', '', query, flags=re.IGNORECASE)
-        
-        # Extract time frames
-        time_frames = {
-            r'\btoday\b': (datetime.now().replace(hour=0, minute=0, second=0), None),
-            r'\byesterday\b': ((datetime.now() - timedelta(days=1)).replace(hour=0, minute=0, second=0), datetime.now().replace(hour=0, minute=0, second=0)),
-            r'\blast\s+(\d+)\s+days?\b': lambda m: (datetime.now() - timedelta(days=int(m.group(1))), None),
-            r'\blast\s+week\b': (datetime.now() - timedelta(days=7), None),
-            r'\blast\s+month\b': (datetime.now() - timedelta(days=30), None),
-            r'\blast\s+year\b': (datetime.now() - timedelta(days=365), None)
-        }
-        
-        for pattern, time_func in time_frames.items():
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                if callable(time_func):
-                    start_time, end_time = time_func(match)
-                else:
-                    start_time, end_time = time_func
-                
-                params["modified_after"] = start_time
-                if end_time:
-                    params["modified_before"] = end_time
-                
-                # Remove the time frame from the query for cleaner keyword search
-                query = re.sub(pattern, '', query, flags=re.IGNORECASE)
-                break
-        
-        # Extract size constraints
-        size_patterns = {
-            r'\blarger\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'min_size',
-            r'\bsmaller\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'max_size',
-            r'\bbigger\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'min_size',
-            r'\bless\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'max_size'
-        }
-        
-        for pattern, param_name in size_patterns.items():
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                size_value = int(match.group(1))
-                size_unit = match.group(2).upper()
-                
-                # Convert to bytes
-                multipliers = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
-                size_in_bytes = size_value * multipliers.get(size_unit, 1)
-                
-                params[param_name] = size_in_bytes
-                
-                # Remove the size constraint from the query
-                query = re.sub(pattern, '', query, flags=re.IGNORECASE)
-        
-        # Extract limit
-        limit_match = re.search(r'\blimit\s+(\d+)\b|\btop\s+(\d+)\b', query, re.IGNORECASE)
-        if limit_match:
-            limit = int(limit_match.group(1) or limit_match.group(2))
-            params["limit"] = min(limit, 100)  # Cap at 100 results
-            # Remove the limit from the query
-            query = re.sub(r'\blimit\s+(\d+)\b|\btop\s+(\d+)\b', '', query, flags=re.IGNORECASE)
-        
-        # The remaining text becomes the query
-        params["query"] = query.strip()
+        params = query_parser.parse_query(query)
+        query = params["query"]
         
         # If no path specified, use user's home directory
         if not params["path"]:
@@ -191,37 +115,60 @@ class FileSearchAdapter:
         Returns:
             Formatted results list
         """
-        formatted = []
-        for item in results:
-            # Format file size for display
-            size_bytes = item.get("size", 0)
-            if size_bytes < 1024:
-                size_str = f"{size_bytes} B"
-            elif size_bytes < 1024**2:
-                size_str = f"{size_bytes/1024:.1f} KB"
-            elif size_bytes < 1024**3:
-                size_str = f"{size_bytes/1024**2:.1f} MB"
-            else:
-                size_str = f"{size_bytes/1024**3:.1f} GB"
-            
-            # Format date for display
-            date_str = item.get("date_modified", "")
-            if date_str:
-                try:
-                    date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    date_str = date_obj.strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, TypeError):
-                    pass
-            
-            formatted.append({
-                "name": item.get("name", ""),
-                "path": item.get("path", ""),
+        if not results:
+            return []
+        
+        # Pull each field out column-wise, then format sizes and dates per column
+        names = [item.get("name", "") for item in results]
+        paths = [item.get("path", "") for item in results]
+        folders = [item.get("is_folder", False) for item in results]
+        size_strs = [self._format_size(item.get("size", 0)) for item in results]
+        date_strs = [self._format_date(item.get("date_modified", "")) for item in results]
+        
+        return [
+            {
+                "name": name,
+                "path": path,
                 "size": size_str,
                 "date_modified": date_str,
-                "is_folder": item.get("is_folder", False)
-            })
+                "is_folder": is_folder
+            }
+            for name, path, size_str, date_str, is_folder
+            in zip(names, paths, size_strs, date_strs, folders)
+        ]
+    
+    @staticmethod
+    def _format_size(size_bytes: int) -> str:
+        """
+        Format a file size in bytes as a human-readable string.
         
-        return formatted
+        Args:
+            size_bytes: File size in bytes
+            
+        Returns:
+            Size string such as "512 B" or "1.5 MB"
+        """
+        divisor, template = _SIZE_FORMATS[bisect_right(_SIZE_THRESHOLDS, size_bytes)]
+        return template.format(size_bytes if divisor == 1 else size_bytes / divisor)
+    
+    @staticmethod
+    def _format_date(date_str: str) -> str:
+        """
+        Format an ISO date string for display.
+        
+        Args:
+            date_str: ISO 8601 date string (may be empty)
+            
+        Returns:
+            Date formatted as "YYYY-MM-DD HH:MM:SS", or the input if it can't be parsed
+        """
+        if date_str:
+            try:
+                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                return date_obj.strftime("%Y-%m-%d %H:%M:%S")
+            except (ValueError, TypeError):
+                pass
+        return date_str
     
     # Implement the file API functions to maintain compatibility
     def list_folders(self, directory: str) -> List[str]:
@@ -4,69 +4,250 @@ File search and command execution module for WorkBuddy (Jarvis Assistant).
 Allows running dynamic shell commands (with safety checks) as returned by the AI, capturing output for file search and related tasks.
 """
 
-import subprocess
+import asyncio
+import locale
+import os
+import re
+import signal
 import shlex
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple, Awaitable, TypeVar
 import logging
-import platform
 
+logger = logging.getLogger(__name__)
 
-def run_shell_command(
-    command: str, cwd: Optional[str] = None, timeout: int = 30
+# Read-only listing commands whose results may be reused for a short while. Commands
+# that chain (including across lines), pipe or redirect, or that make find run
+# actions or write files, are never cached.
+CACHEABLE_COMMAND_RE = re.compile(r"^\s*(dir|ls|where|find|Get-ChildItem)\b", re.IGNORECASE)
+UNCACHEABLE_COMMAND_RE = re.compile(
+    r"[;&|<>`\r\n]|\$\(|\s-(exec|execdir|ok|okdir|delete|fprint|fprint0|fprintf|fls)\b"
+)
+COMMAND_CACHE_TTL_SECONDS = 10.0
+COMMAND_CACHE_MAX_ENTRIES = 128
+# Captured output beyond this many characters is left out of debug logs
+DEBUG_OUTPUT_CHARS = 2048
+# Output is read in chunks and capped per stream; a command exceeding the cap is killed
+MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+# (command, cwd) -> (monotonic timestamp, result)
+_command_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+
+
+def _get_cached_result(key: Tuple[str, Optional[str]]) -> Optional[Dict[str, Any]]:
+    """Return a copy of a still-fresh cached command result, if any."""
+    entry = _command_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > COMMAND_CACHE_TTL_SECONDS:
+        _command_cache.pop(key, None)
+        return None
+    return dict(result)
+
+
+def _store_cached_result(key: Tuple[str, Optional[str]], result: Dict[str, Any]) -> None:
+    """Remember a command result, evicting the oldest entry when the cache is full."""
+    if len(_command_cache) >= COMMAND_CACHE_MAX_ENTRIES and key not in _command_cache:
+        _command_cache.pop(next(iter(_command_cache)), None)
+    _command_cache[key] = (time.monotonic(), dict(result))
+
+
+def _kill_process(proc: asyncio.subprocess.Process) -> None:
+    """Kill a shell command together with any processes it started."""
+    if proc.returncode is not None:
+        return
+    try:
+        if os.name == "posix":
+            # The shell runs in its own session, so its pid is also the process group id
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured process output the way subprocess.run(text=True) would."""
+    text = data.decode(locale.getpreferredencoding(False), errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+async def run_shell_command_async(
+    command: str, cwd: Optional[str] = None, timeout: int = 30, cache: bool = True
 ) -> Dict[str, Any]:
     """
-    Run a shell command safely, capture stdout and stderr, and return the results.
-    On Windows, always use shell=True for 'dir' commands (shell built-in).
-    Prints timing and all outputs for debugging.
+    Run a shell command without blocking the event loop, capture stdout and stderr.
+    The command always runs through the shell, so built-ins like 'dir' work on Windows.
+    Successful read-only listing commands (dir, ls, where, find, Get-ChildItem) are
+    cached per (command, cwd) for a few seconds.
+    Output is streamed and capped at MAX_OUTPUT_BYTES per stream; a command that
+    produces more is killed and its result is marked 'truncated'. On timeout, the
+    output read so far is returned.
+    Logs timing and (truncated) output at DEBUG level.
 
     Args:
         command (str): The shell command to run.
         cwd (Optional[str]): The working directory to run the command in.
         timeout (int): Timeout in seconds for the command.
+        cache (bool): Set to False to bypass the cache and force a fresh run.
 
     Returns:
-        Dict[str, Any]: { 'stdout': ..., 'stderr': ..., 'returncode': ... }
+        Dict[str, Any]: { 'stdout': ..., 'stderr': ..., 'returncode': ..., 'truncated': ... }
     """
-    print(f"Running shell command: {command}")
-    print(f"Working directory: {cwd or 'current'}")
+    cache_key = (command, cwd)
+    cacheable = bool(
+        CACHEABLE_COMMAND_RE.match(command)
+        and not UNCACHEABLE_COMMAND_RE.search(command)
+    )
+    if cacheable and cache:
+        cached = _get_cached_result(cache_key)
+        if cached is not None:
+            logger.debug("Using cached result for shell command: %s", command)
+            return cached
+
+    logger.debug("Running shell command: %s (cwd: %s)", command, cwd or "current")
     start_time = time.time()
     try:
-        if platform.system() == "Windows":
-            # Always use shell=True for dir (shell built-in)
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=(os.name == "posix"),
+        )
+        stdout_data = bytearray()
+        stderr_data = bytearray()
+        truncated = False
+
+        async def _pump(stream: asyncio.StreamReader, buffer: bytearray) -> None:
+            nonlocal truncated
+            while True:
+                chunk = await stream.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    return
+                room = MAX_OUTPUT_BYTES - len(buffer)
+                if len(chunk) > room:
+                    buffer.extend(chunk[:room])
+                    truncated = True
+                    _kill_process(proc)
+                    return
+                buffer.extend(chunk)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _pump(proc.stdout, stdout_data),
+                    _pump(proc.stderr, stderr_data),
+                    proc.wait(),
+                ),
+                timeout,
             )
-        else:
-            # On Unix, shell=True is usually fine
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+        except asyncio.TimeoutError:
+            _kill_process(proc)
+            await proc.wait()
+            message = f"Command '{command}' timed out after {timeout} seconds"
+            logger.error("Command timed out: %s", command)
+            return {
+                "stdout": _decode_output(bytes(stdout_data)).strip(),
+                "stderr": f"Timeout: {message}",
+                "returncode": -1,
+                "truncated": truncated,
+            }
+        if truncated:
+            logger.warning(
+                "Output of %s exceeded %d bytes; command was stopped", command, MAX_OUTPUT_BYTES
+            )
+        stdout = _decode_output(bytes(stdout_data))
+        stderr = _decode_output(bytes(stderr_data))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Command finished in %.2f seconds with return code %s",
+                time.time() - start_time,
+                proc.returncode,
             )
-        elapsed = time.time() - start_time
-        print(f"Command finished in {elapsed:.2f} seconds")
-        print(f"Return code: {result.returncode}")
-        print(f"STDOUT:\n{result.stdout}")
-        print(f"STDERR:\n{result.stderr}")
-        return {
-            "stdout": result.stdout.strip(),
-            "stderr": result.stderr.strip(),
-            "returncode": result.returncode,
+            logger.debug("STDOUT:\n%s", stdout[:DEBUG_OUTPUT_CHARS])
+            logger.debug("STDERR:\n%s", stderr[:DEBUG_OUTPUT_CHARS])
+        result = {
+            "stdout": stdout.strip(),
+            "stderr": stderr.strip(),
+            "returncode": proc.returncode,
+            "truncated": truncated,
         }
-    except subprocess.TimeoutExpired as e:
-        logging.error(f"Command timed out: {command}")
-        print(f"Timeout: {e}")
-        return {"stdout": "", "stderr": f"Timeout: {e}", "returncode": -1}
+        if cacheable and proc.returncode == 0 and not truncated:
+            _store_cached_result(cache_key, result)
+        return result
     except Exception as e:
-        logging.error(f"Command execution error: {e}")
-        print(f"Execution error: {e}")
-        return {"stdout": "", "stderr": str(e), "returncode": -1}
+        logger.error("Command execution error: %s", e)
+        return {"stdout": "", "stderr": str(e), "returncode": -1, "truncated": False}
+
+
+_T = TypeVar("_T")
+
+
+def _run_blocking(coro: Awaitable[_T]) -> _T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    asyncio.run can't be nested, so when the caller is already inside a running event
+    loop the coroutine runs on a private loop in a helper thread instead.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def run_shell_command(
+    command: str, cwd: Optional[str] = None, timeout: int = 30, cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Run a shell command safely, capture stdout and stderr, and return the results.
+    Blocking wrapper around run_shell_command_async for synchronous callers; async
+    callers should await run_shell_command_async directly.
+
+    Args:
+        command (str): The shell command to run.
+        cwd (Optional[str]): The working directory to run the command in.
+        timeout (int): Timeout in seconds for the command.
+        cache (bool): Set to False to bypass the result cache and force a fresh run.
+
+    Returns:
+        Dict[str, Any]: { 'stdout': ..., 'stderr': ..., 'returncode': ... }
+    """
+    return _run_blocking(
+        run_shell_command_async(command, cwd=cwd, timeout=timeout, cache=cache)
+    )
+
+
+def run_shell_commands_batch(
+    commands: List[str], cwd: Optional[str] = None, timeout: int = 30
+) -> List[Dict[str, Any]]:
+    """
+    Run several shell commands concurrently and wait for all of them.
+
+    Args:
+        commands (List[str]): The shell commands to run.
+        cwd (Optional[str]): The working directory to run the commands in.
+        timeout (int): Timeout in seconds for each command.
+
+    Returns:
+        List[Dict[str, Any]]: One result dict per command, in the same order.
+    """
+
+    async def _run_all() -> List[Dict[str, Any]]:
+        return await asyncio.gather(
+            *(run_shell_command_async(c, cwd=cwd, timeout=timeout) for c in commands)
+        )
+
+    return _run_blocking(_run_all())
@@ -0,0 +1,126 @@
+"""
+Shared filesystem helpers for the file search modules.
+
+Directory listings are cached per directory and invalidated whenever the
+directory's modification time changes, so repeated lookups of the same folder
+(common when the AI explores a tree over several rounds) only hit the disk once.
+
+Entry types come from os.scandir's cached directory data, so classifying an entry
+needs no extra stat() call except for symlinks. Symlinks are still followed so
+that linked folders (junctions, redirected Documents folders) keep listing as
+folders, as they did with os.path.isdir.
+"""
+
+import os
+import re
+import fnmatch
+from functools import lru_cache
+from typing import List, Pattern, Tuple
+
+# (name, is_dir, is_file) for a single directory entry
+EntryInfo = Tuple[str, bool, bool]
+
+
+@lru_cache(maxsize=128)
+def compile_glob(pattern: str, ignore_case: bool = False) -> Pattern:
+    """
+    Compile a shell-style wildcard pattern once for repeated filename matching.
+
+    Matches case-insensitively on Windows, like fnmatch.fnmatch does.
+
+    Args:
+        pattern: Wildcard pattern such as "*.py"
+        ignore_case: Match case-insensitively on every platform
+
+    Returns:
+        Compiled regular expression equivalent to the pattern
+    """
+    flags = re.IGNORECASE if ignore_case or os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+@lru_cache(maxsize=128)
+def glob_literals(pattern: str) -> Tuple[str, ...]:
+    """
+    Return the lowercase literal fragments every name matching a wildcard pattern contains.
+    
+    Checking these with "in" is much cheaper than running the pattern regex, so they
+    serve as a prefilter before the full match. Patterns with character classes
+    return no fragments, which disables the prefilter.
+    
+    Args:
+        pattern: Wildcard pattern such as "*report*.pdf"
+        
+    Returns:
+        Tuple of fragments, e.g. ("report", ".pdf")
+    """
+    if "[" in pattern:
+        return ()
+    return tuple(fragment.lower() for fragment in re.split(r"[*?]", pattern) if fragment)
+
+
+@lru_cache(maxsize=64)
+def _scandir_entries(directory: str, mtime_ns: int) -> Tuple[EntryInfo, ...]:
+    """
+    List a directory once per modification time.
+
+    Args:
+        directory: Directory to list
+        mtime_ns: Directory modification time, used only as part of the cache key
+
+    Returns:
+        Tuple of (name, is_dir, is_file) entries
+    """
+    with os.scandir(directory) as it:
+        return tuple((entry.name, entry.is_dir(), entry.is_file()) for entry in it)
+
+
+def scandir_entries(directory: str) -> Tuple[EntryInfo, ...]:
+    """
+    Return the entries of a directory, served from cache while it is unchanged.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Tuple of (name, is_dir, is_file) entries
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    return _scandir_entries(directory, os.stat(directory).st_mtime_ns)
+
+
+def list_folders(directory: str) -> List[str]:
+    """
+    Return all folders in the given directory.
+
+    Args:
+        directory: Directory to list folders from
+
+    Returns:
+        List of folder names
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    return [name for name, is_dir, _ in scandir_entries(directory) if is_dir]
+
+
+def list_files(directory: str, pattern: str = "*") -> List[str]:
+    """
+    Return all files matching the pattern in the directory (non-recursive).
+
+    Args:
+        directory: Directory to list files from
+        pattern: Wildcard pattern to filter files
+
+    Returns:
+        List of file names
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    pattern_regex = compile_glob(pattern)
+    return [name for name, _, is_file in scandir_entries(directory)
+            if is_file and pattern_regex.match(name)]
@@ -4,9 +4,26 @@ Hotkeys module for WorkBuddy.
 Manages global keyboard shortcuts for WorkBuddy actions.
 """
 
-import keyboard
 import logging
-from typing import Callable, Dict, Optional, Any
+import time
+from typing import Callable, Dict, Optional, Any, Tuple
+
+# QTimer.singleShot, resolved on first registration so importing this module doesn't load Qt
+_single_shot: Optional[Callable] = None
+_single_shot_resolved = False
+
+
+def _qt_single_shot() -> Optional[Callable]:
+    """Return QTimer.singleShot, importing PyQt6 on first use (None if it isn't installed)."""
+    global _single_shot, _single_shot_resolved
+    if not _single_shot_resolved:
+        try:
+            from PyQt6.QtCore import QTimer
+            _single_shot = QTimer.singleShot
+        except ImportError:
+            _single_shot = None
+        _single_shot_resolved = True
+    return _single_shot
 
 
 class HotkeyManager:
@@ -19,32 +36,73 @@ class HotkeyManager:
 
     def __init__(self) -> None:
         """Initialize the HotkeyManager."""
-        self.registered_hotkeys: Dict[str, Callable] = {}
+        # action name -> (hotkey string, user callback, handle returned by keyboard.add_hotkey)
+        self.registered_hotkeys: Dict[str, Tuple[str, Callable, Callable]] = {}
         self.default_hotkey = "alt+shift+w"  # Default hotkey for showing/hiding WorkBuddy
         self.logger = logging.getLogger(__name__)
+        # Repeated fires of the same hotkey within this window are dropped
+        self.debounce_ms = 150
+        self._last_fire: Dict[str, float] = {}
+        # The keyboard library installs native hooks on import, so it is loaded on first use
+        self._kb = None
         
-    def register_show_hide(self, callback: Callable[[], None], hotkey: Optional[str] = None) -> bool:
+    def _kb_lib(self):
+        """Return the keyboard module, importing it on first use."""
+        if self._kb is None:
+            import keyboard
+            self._kb = keyboard
+        return self._kb
+        
+    def _debounced(self, action_name: str, debounce_ms: int) -> bool:
+        """
+        Record a hotkey fire and report whether it should be ignored.
+        
+        Args:
+            action_name: The name of the action that fired
+            debounce_ms: Debounce window in milliseconds (0 disables debouncing)
+            
+        Returns:
+            True if the fire came too soon after the previous one, False otherwise
+        """
+        if debounce_ms <= 0:
+            return False
+        now = time.monotonic()
+        if (now - self._last_fire.get(action_name, float("-inf"))) * 1000 < debounce_ms:
+            return True
+        self._last_fire[action_name] = now
+        return False
+    
+    def register_show_hide(self, callback: Callable[[], None], hotkey: Optional[str] = None,
+                           debounce_ms: Optional[int] = None) -> bool:
         """
         Register the show/hide hotkey for the WorkBuddy overlay.
         
         Args:
             callback: Function to call when the hotkey is pressed
             hotkey: Custom hotkey combination (default: alt+shift+w)
+            debounce_ms: Ignore repeat presses within this many milliseconds
+                         (default: self.debounce_ms, 0 to disable)
             
         Returns:
             True if registration was successful, False otherwise
         """
         hotkey_to_use = hotkey or self.default_hotkey
+        debounce = self.debounce_ms if debounce_ms is None else debounce_ms
+        single_shot = _qt_single_shot()
         
         # Create a wrapper function that catches exceptions
         def safe_callback():
+            if self._debounced("show_hide", debounce):
+                return
             try:
                 self.logger.info(f"Show/hide hotkey triggered: {hotkey_to_use}")
                 
                 # Important: Use a Qt timer to ensure the callback executes in the main thread
                 # This prevents crashes due to thread safety issues
-                from PyQt6.QtCore import QTimer  
-                QTimer.singleShot(0, callback)
+                if single_shot is not None:
+                    single_shot(0, callback)
+                else:
+                    callback()
                 
             except Exception as e:
                 self.logger.error(f"Error in hotkey callback: {e}")
@@ -52,15 +110,16 @@ class HotkeyManager:
                 self.logger.error(traceback.format_exc())
         
         try:
-            keyboard.add_hotkey(hotkey_to_use, safe_callback)
-            self.registered_hotkeys["show_hide"] = callback
+            handle = self._kb_lib().add_hotkey(hotkey_to_use, safe_callback)
+            self.registered_hotkeys["show_hide"] = (hotkey_to_use, callback, handle)
             self.logger.info(f"Registered show/hide hotkey: {hotkey_to_use}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to register hotkey {hotkey_to_use}: {e}")
             return False
     
-    def register_hotkey(self, hotkey: str, callback: Callable[[], None], action_name: str) -> bool:
+    def register_hotkey(self, hotkey: str, callback: Callable[[], None], action_name: str,
+                        debounce_ms: Optional[int] = None) -> bool:
         """
         Register a custom hotkey for any action.
         
@@ -68,18 +127,27 @@ class HotkeyManager:
             hotkey: Hotkey combination (e.g., 'ctrl+alt+s')
             callback: Function to call when the hotkey is pressed
             action_name: Name to identify this hotkey action
+            debounce_ms: Ignore repeat presses within this many milliseconds
+                         (default: self.debounce_ms, 0 to disable)
             
         Returns:
             True if registration was successful, False otherwise
         """
+        debounce = self.debounce_ms if debounce_ms is None else debounce_ms
+        single_shot = _qt_single_shot()
+        
         # Create a wrapper function that catches exceptions
         def safe_callback():
+            if self._debounced(action_name, debounce):
+                return
             try:
                 self.logger.info(f"Hotkey triggered for {action_name}: {hotkey}")
                 
                 # Important: Use Qt timer to ensure callback executes in the main thread
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(0, callback)
+                if single_shot is not None:
+                    single_shot(0, callback)
+                else:
+                    callback()
                 
             except Exception as e:
                 self.logger.error(f"Error in hotkey callback for {action_name}: {e}")
@@ -87,8 +155,8 @@ class HotkeyManager:
                 self.logger.error(traceback.format_exc())
         
         try:
-            keyboard.add_hotkey(hotkey, safe_callback)
-            self.registered_hotkeys[action_name] = callback
+            handle = self._kb_lib().add_hotkey(hotkey, safe_callback)
+            self.registered_hotkeys[action_name] = (hotkey, callback, handle)
             self.logger.info(f"Registered hotkey for {action_name}: {hotkey}")
             return True
         except Exception as e:
@@ -110,19 +178,10 @@ class HotkeyManager:
             return False
             
         try:
-            # The keyboard library doesn't have a direct way to unregister by callback,
-            # so we have to use a workaround
-            # TODO: Implement better unregistration when keyboard library adds support
-            keyboard.unhook_all_hotkeys()
-            
-            # Re-register all hotkeys except the one we want to remove
-            for name, callback in self.registered_hotkeys.items():
-                if name != action_name:
-                    # This is simplified and not ideal - in a real implementation 
-                    # we would need to store the original hotkey string
-                    keyboard.add_hotkey(self.default_hotkey, callback)
-                    
+            _, _, handle = self.registered_hotkeys[action_name]
+            self._kb_lib().remove_hotkey(handle)
             del self.registered_hotkeys[action_name]
+            self._last_fire.pop(action_name, None)
             self.logger.info(f"Unregistered hotkey for {action_name}")
             return True
         except Exception as e:
@@ -4,10 +4,25 @@ Notification module for WorkBuddy.
 Handles Windows toast notifications with custom app name and icon using winotify.
 """
 
-from winotify import Notification, audio
 import os
+from functools import lru_cache
 from typing import Optional
 
+# Resolved relative to the project rather than the working directory, and checked
+# once: the bundled icon doesn't come and go while the app runs
+DEFAULT_ICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets",
+    "workbuddy_icon.png",
+)
+_DEFAULT_ICON = DEFAULT_ICON_PATH if os.path.exists(DEFAULT_ICON_PATH) else None
+
+
+@lru_cache(maxsize=32)
+def _existing_icon(icon_path: str) -> Optional[str]:
+    """Return the icon path if the file exists, checking each path only once."""
+    return icon_path if os.path.exists(icon_path) else None
+
 
 def show_notification(title: str, message: str, icon_path: Optional[str] = None) -> int:
     """
@@ -22,14 +37,19 @@ def show_notification(title: str, message: str, icon_path: Optional[str] = None)
         0 if successful, 1 if an error occurred.
     """
     try:
+        # Imported on first use so importing this module doesn't load winotify
+        from winotify import Notification, audio
+
         if icon_path is None:
             # Default to assets/workbuddy_icon.png
-            icon_path = os.path.abspath(os.path.join("assets", "workbuddy_icon.png"))
+            icon = _DEFAULT_ICON
+        else:
+            icon = _existing_icon(icon_path)
         toast = Notification(
             app_id="WorkBuddy",  # This sets the app name!
             title=title,
             msg=message,
-            icon=icon_path if os.path.exists(icon_path) else None,
+            icon=icon,
         )
         toast.set_audio(audio.Default, loop=False)
         toast.show()
@@ -6,10 +6,48 @@ This adapter ensures backward compatibility while enabling prioritized searching
 import os
 import re
 import datetime
+import logging
+import time
+from collections import deque
 from typing import List, Dict, Any, Optional, Union
 
+from core import fs_ops, query_parser
 from core.search_navigator import search_navigator
 
+logger = logging.getLogger(__name__)
+
+_COMMON_LOCATIONS = [
+    (re.compile(r'\bdesktop\b', re.IGNORECASE), 'Desktop'),
+    (re.compile(r'\bdocuments\b', re.IGNORECASE), 'Documents'),
+    (re.compile(r'\bdownloads\b', re.IGNORECASE), 'Downloads'),
+    (re.compile(r'\bpictures\b', re.IGNORECASE), 'Pictures'),
+    (re.compile(r'\bmusic\b', re.IGNORECASE), 'Music'),
+    (re.compile(r'\bvideos\b', re.IGNORECASE), 'Videos'),
+]
+
+
+def _to_epoch(value: Union[None, int, float, str, datetime.datetime]) -> Optional[float]:
+    """
+    Normalize a modification time to POSIX seconds.
+    
+    Args:
+        value: Epoch seconds, an ISO 8601 string, a datetime, or None
+        
+    Returns:
+        Seconds since the epoch, or None if the value is missing or can't be parsed
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return value.timestamp()
+
+
 class PrioritizedSearchAdapter:
     """
     Adapter class that provides compatibility between the SearchNavigator and
@@ -63,57 +101,43 @@ class PrioritizedSearchAdapter:
                 include_system_folders=False
             )
         
-        # Filter results by size if specified
-        if min_size is not None or max_size is not None:
-            filtered_results = []
-            for item in results:
-                size = item.get("size", 0)
-                if (min_size is None or size >= min_size) and (max_size is None or size <= max_size):
-                    filtered_results.append(item)
-            results = filtered_results
-        
-        # Filter results by modification date if specified
-        if modified_after is not None or modified_before is not None:
-            # Convert string dates to datetime objects
-            if isinstance(modified_after, str):
-                modified_after = datetime.datetime.fromisoformat(modified_after.replace('Z', '+00:00'))
-            if isinstance(modified_before, str):
-                modified_before = datetime.datetime.fromisoformat(modified_before.replace('Z', '+00:00'))
-            
-            filtered_results = []
-            for item in results:
-                date_modified = item.get("date_modified", 0)
-                if isinstance(date_modified, (int, float)):
-                    date_modified = datetime.datetime.fromtimestamp(date_modified)
-                elif isinstance(date_modified, str):
-                    try:
-                        date_modified = datetime.datetime.fromisoformat(date_modified.replace('Z', '+00:00'))
-                    except ValueError:
-                        continue
-                
-                if ((modified_after is None or date_modified >= modified_after) and 
-                    (modified_before is None or date_modified <= modified_before)):
-                    filtered_results.append(item)
-            
-            results = filtered_results
+        # Filter by size and modification date and format the survivors in a single
+        # pass, comparing against bounds that are converted once rather than per item
+        filter_by_size = min_size is not None or max_size is not None
+        filter_by_date = modified_after is not None or modified_before is not None
+        after_ts = _to_epoch(modified_after)
+        before_ts = _to_epoch(modified_before)
         
-        # Format results to match the expected API format
         formatted_results = []
         for item in results:
-            # Convert date to ISO format string
+            size = item.get("size", 0)
+            if filter_by_size and ((min_size is not None and size < min_size) or
+                                   (max_size is not None and size > max_size)):
+                continue
+            
             date_modified = item.get("date_modified", 0)
+            if filter_by_date:
+                modified_ts = _to_epoch(date_modified)
+                if (modified_ts is None or
+                        (after_ts is not None and modified_ts < after_ts) or
+                        (before_ts is not None and modified_ts > before_ts)):
+                    continue
+            
+            # Convert date to ISO format string to match the expected API format
             if isinstance(date_modified, (int, float)):
                 date_modified = datetime.datetime.fromtimestamp(date_modified).isoformat()
             
             formatted_results.append({
                 "path": item.get("path", ""),
                 "name": item.get("name", ""),
-                "size": item.get("size", 0),
+                "size": size,
                 "date_modified": date_modified,
                 "is_folder": item.get("is_folder", False)
             })
+            if len(formatted_results) >= limit:
+                break
         
-        return formatted_results[:limit]
+        return formatted_results
     
     def process_query(self, query: str) -> Dict[str, Any]:
         """
@@ -159,111 +183,14 @@ class PrioritizedSearchAdapter:
         Returns:
             Dictionary of search parameters
         """
-        params = {
-            "query": "",
-            "path": None,
-            "file_type": None,
-            "min_size": None,
-            "max_size": None,
-            "modified_after": None,
-            "modified_before": None,
-            "limit": 50
-        }
-        
-        # Extract file types
-        file_type_match = re.search(r'\.([a-zA-Z0-9]+)\b|\bfiles?\s+of\s+type\s+([a-zA-Z0-9]+)|\b([a-zA-Z0-9]+)\s+files?\b', query, re.IGNORECASE)
-        if file_type_match:
-            ext = file_type_match.group(1) or file_type_match.group(2) or file_type_match.group(3)
-            if ext:
-                params["file_type"] = ext.lower()
-                # Remove the file type from the query for cleaner keyword search
-                query = re.sub(r'\.([a-zA-Z0-9]+)\b|\bfiles?\s+of\s+type\s+([a-zA-Z0-9]+)|\b([a-zA-Z0-9]+)\s+files?\b', '', query, flags=re.IGNORECASE)
-        
-        # Extract paths - look for "in [path]" pattern
-        path_match = re.search(r'\bin\s+([\'"]?)([a-zA-Z]:\\[^"\']+|~[^"\']*|\/[^"\']+)(\1)', query, re.IGNORECASE)
-        if path_match:
-            path = path_match.group(2)
-            # Handle home directory
-            if path.startswith('~'):
-                path = os.path.expanduser(path)
-            params["path"] = path
-            # Remove the path from the query for cleaner keyword search
-            query = re.sub(r'\bin\s+([\'"]?)([a-zA-Z]:\\[^"\']+|~[^"\']*|\/[^"\']+)(\1)', '', query, flags=re.IGNORECASE)
-        
-        # Extract time frames
-        time_frames = {
-            r'\btoday\b': (datetime.datetime.now().replace(hour=0, minute=0, second=0), None),
-            r'\byesterday\b': ((datetime.datetime.now() - datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0), datetime.datetime.now().replace(hour=0, minute=0, second=0)),
-            r'\blast\s+(\d+)\s+days?\b': lambda m: (datetime.datetime.now() - datetime.timedelta(days=int(m.group(1))), None),
-            r'\blast\s+week\b': (datetime.datetime.now() - datetime.timedelta(days=7), None),
-            r'\blast\s+month\b': (datetime.datetime.now() - datetime.timedelta(days=30), None),
-            r'\blast\s+year\b': (datetime.datetime.now() - datetime.timedelta(days=365), None)
-        }
-        
-        for pattern, time_func in time_frames.items():
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                if callable(time_func):
-                    start_time, end_time = time_func(match)
-                else:
-                    start_time, end_time = time_func
-                
-                params["modified_after"] = start_time
-                if end_time:
-                    params["modified_before"] = end_time
-                
-                # Remove the time frame from the query for cleaner keyword search
-                query = re.sub(pattern, '', query, flags=re.IGNORECASE)
-                break
-        
-        # Extract size constraints
-        size_patterns = {
-            r'\blarger\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'min_size',
-            r'\bsmaller\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'max_size',
-            r'\bbigger\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'min_size',
-            r'\bless\s+than\s+(\d+)\s*(KB|MB|GB|B)\b': 'max_size'
-        }
-        
-        for pattern, param_name in size_patterns.items():
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                size_value = int(match.group(1))
-                size_unit = match.group(2).upper()
-                
-                # Convert to bytes
-                multipliers = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
-                size_in_bytes = size_value * multipliers.get(size_unit, 1)
-                
-                params[param_name] = size_in_bytes
-                
-                # Remove the size constraint from the query
-                query = re.sub(pattern, '', query, flags=re.IGNORECASE)
-        
-        # Extract limit
-        limit_match = re.search(r'\blimit\s+(\d+)\b|\btop\s+(\d+)\b', query, re.IGNORECASE)
-        if limit_match:
-            limit = int(limit_match.group(1) or limit_match.group(2))
-            params["limit"] = min(limit, 100)  # Cap at 100 results
-            # Remove the limit from the query
-            query = re.sub(r'\blimit\s+(\d+)\b|\btop\s+(\d+)\b', '', query, flags=re.IGNORECASE)
-        
-        # The remaining text becomes the query
-        params["query"] = query.strip()
+        params = query_parser.parse_query(query)
+        query = params["query"]
         
         # If no path specified but location mentioned, use our similar_locations feature
         if not params["path"]:
             # Check if query mentions desktop, documents, etc.
-            common_locations = {
-                r'\bdesktop\b': 'Desktop',
-                r'\bdocuments\b': 'Documents',
-                r'\bdownloads\b': 'Downloads',
-                r'\bpictures\b': 'Pictures',
-                r'\bmusic\b': 'Music',
-                r'\bvideos\b': 'Videos'
-            }
-            
-            for pattern, folder in common_locations.items():
-                if re.search(pattern, query, re.IGNORECASE):
+            for regex, folder in _COMMON_LOCATIONS:
+                if regex.search(query):
                     # Try to locate the folder using search_navigator
                     matches = search_navigator.find_similar_locations(folder)
                     if matches:
@@ -284,7 +211,7 @@ class PrioritizedSearchAdapter:
             List of folder names
         """
         try:
-            return [f for f in os.listdir(directory) if os.path.isdir(os.path.join(directory, f))]
+            return fs_ops.list_folders(directory)
         except Exception as e:
             print(f"Error listing folders: {e}")
             return []
@@ -300,10 +227,8 @@ class PrioritizedSearchAdapter:
         Returns:
             List of file names
         """
-        import fnmatch
         try:
-            return [f for f in os.listdir(directory) 
-                    if os.path.isfile(os.path.join(directory, f)) and fnmatch.fnmatch(f, pattern)]
+            return fs_ops.list_files(directory, pattern)
         except Exception as e:
             print(f"Error listing files: {e}")
             return []
@@ -319,83 +244,94 @@ class PrioritizedSearchAdapter:
         Returns:
             List of matched file paths
         """
-        import traceback
-        import time
-        import threading
-        import fnmatch
-        
         try:
-            print(f"DEBUG: search_files_recursive called with directory={directory}, pattern={pattern}")
+            logger.debug("search_files_recursive called with directory=%s, pattern=%s", directory, pattern)
             
             # Make sure directory exists
             directory = os.path.expanduser(directory)
             if not os.path.isdir(directory):
-                print(f"DEBUG: Directory does not exist: {directory}")
+                logger.debug("Directory does not exist: %s", directory)
                 return []
             
-            print(f"DEBUG: Directory exists and expanded to: {directory}")
+            logger.debug("Directory exists and expanded to: %s", directory)
             
-            # Use a faster, non-recursive approach first for common file extensions
-            # This is a quick search to see if we can find obvious matches quickly
-            matched_files = []
             max_time = 5  # Maximum search time in seconds
-            start_time = time.time()
-            
-            # Quick file scan using glob which is much faster than os.walk for simple patterns
-            import glob
-            
-            # Try direct pattern match first (fastest)
-            quick_matches = glob.glob(os.path.join(directory, pattern))
-            quick_matches.extend(glob.glob(os.path.join(directory, "*", pattern)))
-            
-            # If we found files or this is a simple pattern, use those results
-            if quick_matches:
-                print(f"DEBUG: Quick search found {len(quick_matches)} matches")
-                return [f for f in quick_matches if os.path.isfile(f)]
+            deadline = time.monotonic() + max_time
             
-            # Use a fallback to os.walk but with a time limit
-            results = []
-            search_complete = False
-            
-            def search_worker():
-                nonlocal results, search_complete
-                try:
-                    # For safety, limit depth and max results
-                    search_results = search_navigator.search_location(
-                        location=directory,
-                        name_pattern=pattern,
-                        max_depth=3,  # Reduce max depth for performance
-                        max_results=50  # Limit results for performance
-                    )
-                    # Extract just the file paths from the results
-                    results = [item.get("path", "") for item in search_results 
-                              if not item.get("is_folder", False)]
-                    search_complete = True
-                except Exception as e:
-                    print(f"DEBUG: Search worker exception: {e}")
-                    search_complete = True
-            
-            # Start search in background thread
-            search_thread = threading.Thread(target=search_worker)
-            search_thread.daemon = True  # Allow main thread to exit
-            search_thread.start()
-            
-            # Wait for search to complete or timeout
-            search_thread.join(max_time)
-            
-            if not search_complete:
-                print(f"DEBUG: Search timed out after {max_time} seconds")
-                # Even if timed out, return what we found so far
-                return results
-            
-            print(f"DEBUG: Search completed, found {len(results)} files")
+            # A single breadth-first, depth- and time-limited walk; shallow matches are
+            # found first, so no separate glob pass over the top levels is needed
+            results = self._scan_tree(
+                directory,
+                pattern,
+                max_depth=3,  # Reduce max depth for performance
+                max_results=50,  # Limit results for performance
+                deadline=deadline
+            )
+            logger.debug("Search completed, found %d files", len(results))
             return results
             
         except Exception as e:
-            print(f"DEBUG: Exception in search_files_recursive: {str(e)}")
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.exception("Exception in search_files_recursive: %s", e)
             return []
     
+    def _scan_tree(self, directory: str, pattern: str, max_depth: int,
+                   max_results: int, deadline: float) -> List[str]:
+        """
+        Walk a directory tree breadth-first with os.scandir, collecting matching files.
+        
+        Shallower matches are returned before deeper ones. DirEntry type checks use
+        the information returned by the directory read, so no extra stat call is
+        made per entry. Hidden and excluded folders are skipped like in SearchNavigator.
+        
+        Args:
+            directory: Directory to search in
+            pattern: Wildcard pattern to match filenames; plain words match anywhere in the name
+            max_depth: Maximum folder depth below the directory to descend
+            max_results: Maximum number of paths to return
+            deadline: time.monotonic() value after which the walk stops early
+            
+        Returns:
+            List of matched file paths (partial if the deadline was reached)
+        """
+        if not any(ch in pattern for ch in "*?["):
+            pattern = f"*{pattern}*"
+        pattern_regex = fs_ops.compile_glob(pattern, ignore_case=True)
+        # Literal parts of the pattern that must appear in a matching name; most
+        # entries are rejected by these substring checks without running the regex
+        required = fs_ops.glob_literals(pattern)
+        excluded_dirs = search_navigator.excluded_dirs
+        
+        results = []
+        queue = deque([(directory, 0)])
+        while queue:
+            if time.monotonic() > deadline:
+                logger.debug("Search timed out, returning %d partial results", len(results))
+                break
+            
+            current, depth = queue.popleft()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if (depth < max_depth and not entry.name.startswith('.')
+                                    and entry.name not in excluded_dirs):
+                                queue.append((entry.path, depth + 1))
+                        elif entry.is_file():
+                            name = entry.name
+                            if required:
+                                name_lower = name.lower()
+                                if not all(fragment in name_lower for fragment in required):
+                                    continue
+                            if not pattern_regex.match(name):
+                                continue
+                            results.append(entry.path)
+                            if len(results) >= max_results:
+                                return results
+            except OSError as e:
+                logger.debug("Skipping unreadable directory %s: %s", current, e)
+        
+        return results
+    
     def file_exists(self, path: str) -> bool:
         """
         Check if a file exists at the given path.
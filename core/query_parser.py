@@ -0,0 +1,152 @@
+"""
+Shared natural language query parsing for the file search adapters.
+
+Both adapters turn phrases such as "pdf files", "in ~/Projects", "last week",
+"larger than 10 MB" and "top 5" into search parameters the same way; only the
+fallback location for a query without a path differs, so that stays with each
+adapter.
+"""
+
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Every parameter phrase parse_query understands, as one alternation so the query
+# is scanned once. The outer named group of each alternative identifies its kind.
+_QUERY_TOKEN_RE = re.compile(
+    r'(?P<file_type>\.(?P<ext_dot>[a-zA-Z0-9]+)\b'
+    r'|\bfiles?\s+of\s+type\s+(?P<ext_of_type>[a-zA-Z0-9]+)'
+    r'|\b(?P<ext_word>[a-zA-Z0-9]+)\s+files?\b)'
+    # A quoted path runs to the closing quote. An unquoted one ends at whitespace,
+    # unless the next word continues it with a separator (C:\Program Files\App), so
+    # phrases and search terms after it are still seen
+    r'|(?P<path>\bin\s+(?:(?P<quote>[\'"])(?P<quoted_path>(?:[a-zA-Z]:\\|~|\/)[^"\']*)(?P=quote)'
+    r'|(?P<path_value>(?:[a-zA-Z]:\\|~|\/)[^\s"\']*(?:\s+[^\s"\']*[\\/][^\s"\']*)*)))'
+    r'|(?P<today>\btoday\b)'
+    r'|(?P<yesterday>\byesterday\b)'
+    r'|(?P<last_days>\blast\s+(?P<days>\d+)\s+days?\b)'
+    r'|(?P<last_week>\blast\s+week\b)'
+    r'|(?P<last_month>\blast\s+month\b)'
+    r'|(?P<last_year>\blast\s+year\b)'
+    r'|(?P<size>\b(?P<size_op>larger|bigger|smaller|less)\s+than\s+(?P<size_value>\d+)\s*(?P<size_unit>KB|MB|GB|B)\b)'
+    r'|(?P<limit>\blimit\s+(?P<limit_value>\d+)\b|\btop\s+(?P<top_value>\d+)\b)',
+    re.IGNORECASE
+)
+
+
+def _start_of_day(moment: datetime) -> datetime:
+    """Return midnight at the start of the given moment's day."""
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# Time frame kinds and the (modified_after, modified_before) range each one maps to,
+# built from a single "now" snapshot taken per parse
+_TIMEFRAME_BUILDERS: Dict[str, Callable[[datetime, re.Match], Tuple[datetime, Optional[datetime]]]] = {
+    "today": lambda now, m: (_start_of_day(now), None),
+    "yesterday": lambda now, m: (_start_of_day(now - timedelta(days=1)), _start_of_day(now)),
+    "last_days": lambda now, m: (now - timedelta(days=int(m.group("days"))), None),
+    "last_week": lambda now, m: (now - timedelta(days=7), None),
+    "last_month": lambda now, m: (now - timedelta(days=30), None),
+    "last_year": lambda now, m: (now - timedelta(days=365), None),
+}
+
+_SIZE_PARAMS = {"larger": "min_size", "bigger": "min_size", "smaller": "max_size", "less": "max_size"}
+_SIZE_MULTIPLIERS = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
+
+
+def strip_spans(text: str, spans: List[Tuple[int, int]]) -> str:
+    """
+    Remove the given spans from a string in a single pass.
+
+    Args:
+        text: Original string
+        spans: (start, end) spans to remove
+
+    Returns:
+        The surviving text, with the remaining pieces joined by single spaces
+    """
+    parts = []
+    pos = 0
+    for start, end in sorted(spans):
+        parts.append(text[pos:start])
+        pos = max(pos, end)
+    parts.append(text[pos:])
+    return ' '.join(part.strip() for part in parts if part.strip())
+
+
+def parse_query(query: str) -> Dict[str, Any]:
+    """
+    Parse a natural language query into search parameters.
+
+    Args:
+        query: Natural language query string
+
+    Returns:
+        Dictionary of search parameters; "query" holds the text left once the
+        parameter phrases are removed, and "path" is None if no path was given
+    """
+    params = {
+        "query": "",
+        "path": None,
+        "file_type": None,
+        "min_size": None,
+        "max_size": None,
+        "modified_after": None,
+        "modified_before": None,
+        "limit": 50
+    }
+
+    # Spans of the original query consumed by extracted parameters; stripped in
+    # a single pass at the end
+    spans: List[Tuple[int, int]] = []
+    timeframe_kind = None
+    limit_found = False
+    now = datetime.now()
+
+    # One scan over the query extracts every parameter phrase
+    for match in _QUERY_TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+
+        if kind == "file_type":
+            # First file type mentioned wins; every file type phrase is removed
+            if not params["file_type"]:
+                ext = match.group("ext_dot") or match.group("ext_of_type") or match.group("ext_word")
+                params["file_type"] = ext.lower()
+
+        elif kind == "path":
+            if not params["path"]:
+                path = match.group("quoted_path") or match.group("path_value")
+                # Handle home directory
+                if path.startswith('~'):
+                    path = os.path.expanduser(path)
+                params["path"] = path
+
+        elif kind in _TIMEFRAME_BUILDERS:
+            # Only the first time frame is used; other time frame phrases stay as keywords
+            if timeframe_kind is None:
+                timeframe_kind = kind
+                start_time, end_time = _TIMEFRAME_BUILDERS[kind](now, match)
+                params["modified_after"] = start_time
+                if end_time:
+                    params["modified_before"] = end_time
+            elif kind != timeframe_kind:
+                continue
+
+        elif kind == "size":
+            size_value = int(match.group("size_value"))
+            size_unit = match.group("size_unit").upper()
+            param_name = _SIZE_PARAMS[match.group("size_op").lower()]
+            params[param_name] = size_value * _SIZE_MULTIPLIERS.get(size_unit, 1)
+
+        elif kind == "limit":
+            if not limit_found:
+                limit_found = True
+                limit = int(match.group("limit_value") or match.group("top_value"))
+                params["limit"] = min(limit, 100)  # Cap at 100 results
+
+        spans.append(match.span())
+
+    # The remaining text becomes the query
+    params["query"] = strip_spans(query, spans)
+    return params
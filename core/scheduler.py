@@ -2,83 +2,92 @@
 Scheduler module for WorkBuddy (Jarvis Assistant).
 
 Handles scheduling, firing, and persistence of reminders using APScheduler.
-On startup, reloads all pending reminders from storage and schedules or fires them as needed.
+Reminders live only in storage; a single interval job polls for due reminders
+and fires them, so scheduler state stays constant however many reminders exist.
 """
 
+import sqlite3
 from datetime import datetime
 from typing import Any, Callable, Optional
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.jobstores.base import JobLookupError
 from core import storage
 from core.notifications import show_notification
 import logging
 from integrations.github import GitHubIntegration
 
 
-scheduler = BackgroundScheduler()
-scheduler.start()
-
-github_integration = GitHubIntegration()
-
 GITHUB_POLL_INTERVAL_MINUTES = 5
-
-
-def _reminder_job(reminder_id: int, message: str) -> None:
-    """Job to fire when a reminder is due."""
-    show_notification("WorkBuddy Reminder", message)
-    storage.mark_reminder_done(reminder_id)
-    storage.add_notification("WorkBuddy Reminder", message)
+REMINDER_TICK_SECONDS = 5
+
+# Created on first use so importing this module for a helper doesn't start threads
+# or open a GitHub connection
+_scheduler: Optional[BackgroundScheduler] = None
+_github_integration: Optional[GitHubIntegration] = None
+
+
+def get_github_integration() -> GitHubIntegration:
+    """Return the shared GitHubIntegration, creating it on first use."""
+    global _github_integration
+    if _github_integration is None:
+        _github_integration = GitHubIntegration()
+    return _github_integration
+
+
+def get_scheduler() -> BackgroundScheduler:
+    """Return the running scheduler, starting it and its polling jobs on first use."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = BackgroundScheduler()
+        _scheduler.start()
+        _scheduler.add_job(
+            poll_github,
+            "interval",
+            minutes=GITHUB_POLL_INTERVAL_MINUTES,
+            id="github_polling_job",
+            replace_existing=True,
+        )
+        _scheduler.add_job(
+            _reminder_tick,
+            "interval",
+            seconds=REMINDER_TICK_SECONDS,
+            id="reminder_tick",
+            replace_existing=True,
+        )
+    return _scheduler
+
+
+def _fire_due_reminders(title: str) -> None:
+    """Show and record every pending reminder that is due, then mark them done."""
+    due = storage.get_due_reminders(datetime.now().isoformat())
+    for _reminder_id, message in due:
+        show_notification(title, message)
+    storage.add_notifications([(title, message) for _, message in due])
+    storage.mark_reminders_done([reminder_id for reminder_id, _ in due])
+
+
+def _reminder_tick() -> None:
+    """Job run every few seconds to fire reminders that have come due."""
+    _fire_due_reminders("WorkBuddy Reminder")
 
 
 def schedule_reminder(message: str, remind_at: datetime) -> int:
-    """Add a reminder to storage and schedule it with APScheduler. Returns the reminder ID."""
+    """Add a reminder to storage; the reminder tick fires it when due. Returns the reminder ID."""
     reminder_id = storage.add_reminder(message, remind_at.isoformat())
     print(f"Scheduling reminder {reminder_id} for {remind_at}")
-    scheduler.add_job(
-        _reminder_job,
-        "date",
-        run_date=remind_at,
-        args=[reminder_id, message],
-        id=f"reminder_{reminder_id}",
-        replace_existing=True,
-    )
     return reminder_id
 
 
 def reload_reminders() -> None:
-    """Reload all pending reminders from storage and schedule or fire them as needed."""
-    now = datetime.now()
-    for reminder_id, message, remind_at_str in storage.get_pending_reminders():
-        try:
-            remind_at = datetime.fromisoformat(remind_at_str)
-        except ValueError:
-            continue  # Skip invalid dates
-        if remind_at <= now:
-            # Missed reminder: fire immediately
-            show_notification("Missed Reminder", message)
-            storage.mark_reminder_done(reminder_id)
-            storage.add_notification("Missed Reminder", message)
-        else:
-            # Schedule future reminder
-            scheduler.add_job(
-                _reminder_job,
-                "date",
-                run_date=remind_at,
-                args=[reminder_id, message],
-                id=f"reminder_{reminder_id}",
-                replace_existing=True,
-            )
+    """Fire reminders missed while WorkBuddy was not running; future ones are left to the tick."""
+    _fire_due_reminders("Missed Reminder")
 
 
 def cancel_reminder(reminder_id: int) -> None:
-    """Cancel a scheduled reminder by ID."""
-    try:
-        scheduler.remove_job(f"reminder_{reminder_id}")
-    except JobLookupError:
-        pass
+    """Cancel a pending reminder by ID so the reminder tick never fires it."""
+    storage.mark_reminders_done([reminder_id])
 
 
-def get_all_reminders_with_status() -> list[dict]:
+def get_all_reminders_with_status() -> list[sqlite3.Row]:
     """Get all reminders with their status as a string."""
     return storage.get_all_reminders_with_status()
 
@@ -86,23 +95,19 @@ def get_all_reminders_with_status() -> list[dict]:
 def reschedule_reminder(
     reminder_id: int, new_message: str, new_remind_at: datetime
 ) -> None:
-    """Cancel and reschedule a reminder job with updated message and time."""
-    cancel_reminder(reminder_id)
+    """Update a reminder's message and time and make it pending again, so the reminder
+    tick fires it at the new time even if it had already fired or been cancelled."""
     logging.info(
         f"[Scheduler] Rescheduling reminder id={reminder_id} new_message={new_message} new_time={new_remind_at.isoformat()}"
     )
-    scheduler.add_job(
-        _reminder_job,
-        "date",
-        run_date=new_remind_at,
-        args=[reminder_id, new_message],
-        id=f"reminder_{reminder_id}",
-        replace_existing=True,
+    storage.update_reminder(
+        reminder_id, new_message, new_remind_at.isoformat(), reset_done=True
     )
 
 
 def poll_github() -> None:
     """Poll GitHub for new notifications and PRs, and trigger updates if found."""
+    github_integration = get_github_integration()
     if not github_integration.is_configured():
         logging.info("[GitHub Poll] Integration not configured.")
         return
@@ -113,12 +118,3 @@ def poll_github() -> None:
         f"[GitHub Poll] {len(notifications) if isinstance(notifications, list) else 0} notifications, {len(prs) if isinstance(prs, list) else 0} PRs."
     )
 
-
-# Schedule the polling job
-scheduler.add_job(
-    poll_github,
-    "interval",
-    minutes=GITHUB_POLL_INTERVAL_MINUTES,
-    id="github_polling_job",
-    replace_existing=True,
-)
@@ -6,13 +6,70 @@ Implements a systematic approach to searching files across the filesystem.
 import os
 import re
 import string
-import fnmatch
 import logging
 import platform
 import shutil
-from typing import List, Dict, Any, Optional, Union, Tuple, Set, Generator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Union, Tuple, Set, Generator, Pattern
 from pathlib import Path
 
+from core import fs_ops
+
+# Optional linear-time regex engine for user-supplied filename patterns
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Optional[Pattern]:
+    """
+    Compile a filename pattern as a case-insensitive regex, once per distinct pattern.
+    
+    Uses RE2 when the google-re2 package is installed, so pathological patterns
+    can't backtrack over every filename; patterns RE2 doesn't support (such as
+    backreferences) fall back to the re module.
+    
+    Args:
+        pattern: Regular expression to compile
+        
+    Returns:
+        The compiled pattern, or None if it isn't a valid regex
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(f"(?i){pattern}")
+        except re2.error:
+            pass
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _priority_for_directory(directory: str, prefixes: Tuple[Tuple[str, int], ...]) -> int:
+    """
+    Look up the priority tier of a directory, once per directory.
+    
+    Args:
+        directory: Directory path, normalized with os.path.normcase
+        prefixes: (location prefix, tier) pairs, best tier first
+        
+    Returns:
+        Priority level (1-5, lower is better), or 999 for unknown locations
+    """
+    directory = os.path.join(directory, "")
+    for prefix, tier in prefixes:
+        if directory.startswith(prefix):
+            return tier
+    return 999
+
+
 class SearchNavigator:
     """
     A file system navigation and search utility with prioritized search locations.
@@ -27,9 +84,20 @@ class SearchNavigator:
         self.system = platform.system()
         self.user_home = str(Path.home())
         
+        # Directory names never descended into while walking (hidden folders are skipped too)
+        self.excluded_dirs: Set[str] = {"node_modules", ".git", "__pycache__", "AppData"}
+        
         # Initialize prioritized locations
         self._initialize_priority_locations()
         self._initialize_drive_info()
+        self._build_priority_prefixes()
+        
+        # Priority locations paired with their lowercased form, in tier order
+        self._priority_lower: List[Tuple[str, str]] = [
+            (location, location.lower())
+            for tier in range(1, 6)
+            for location in self.priority_locations[tier]
+        ]
     
     def _initialize_priority_locations(self) -> None:
         """
@@ -116,6 +184,21 @@ class SearchNavigator:
                 if os.path.exists(location) and os.path.isdir(location):
                     self.priority_locations[tier].append(location)
     
+    def _build_priority_prefixes(self) -> None:
+        """
+        Flatten the priority locations into (prefix, tier) pairs for priority lookups.
+        
+        Prefixes are normalized and end with a separator, and are kept in tier
+        order, so a directory gets the best tier of every location containing it.
+        A broad location never demotes a file below the tier it would have on its
+        own (with C:\ in tier 1, a file under the home folder stays in tier 1).
+        """
+        prefixes = {}
+        for tier, locations in sorted(self.priority_locations.items()):
+            for location in locations:
+                prefixes.setdefault(os.path.join(os.path.normcase(location), ""), tier)
+        self._priority_prefixes: Tuple[Tuple[str, int], ...] = tuple(prefixes.items())
+    
     def _initialize_drive_info(self) -> None:
         """Initialize information about available drives for systematic searching."""
         self.drives = []
@@ -169,7 +252,8 @@ class SearchNavigator:
                        name_pattern: Optional[str] = None,
                        file_type: Optional[str] = None,
                        max_depth: int = 3,
-                       max_results: int = 100) -> List[Dict[str, Any]]:
+                       max_results: int = 100,
+                       skip_dirs: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
         """
         Search a specific location for files matching criteria.
         
@@ -179,9 +263,12 @@ class SearchNavigator:
             file_type: File extension to filter by (without the dot)
             max_depth: Maximum folder depth to search
             max_results: Maximum number of results to return
+            skip_dirs: Directories (normalized with os.path.normcase) not to descend
+                       into, e.g. other locations that are searched on their own
             
         Returns:
-            List of dictionaries with file information
+            List of dictionaries with file information (path, name, size,
+            date_modified, priority_level); only files are returned
         """
         results = []
         count = 0
@@ -189,57 +276,61 @@ class SearchNavigator:
         if not os.path.exists(location) or not os.path.isdir(location):
             return results
         
-        # Compile regex pattern if provided
+        # Compiled patterns are cached, so repeated calls across priority tiers don't
+        # recompile them; a pattern that isn't a valid regex is used as a glob pattern
         pattern_regex = None
+        glob_regex = None
         if name_pattern:
-            try:
-                pattern_regex = re.compile(name_pattern, re.IGNORECASE)
-            except re.error:
-                # If it's not a valid regex, use it as a glob pattern
-                pass
+            pattern_regex = _compile_pattern(name_pattern)
+            if pattern_regex is None:
+                glob_regex = fs_ops.compile_glob(name_pattern, ignore_case=True)
         
         # Normalize file type
         if file_type and not file_type.startswith('.'):
             file_type = f".{file_type}"
+        if file_type:
+            file_type = file_type.lower()
         
-        # Track current depth
-        for current_depth, (root, dirs, files) in enumerate(self._walk_max_depth(location, max_depth)):
+        for root, dirs, files in self._walk_max_depth(location, max_depth, skip_dirs):
             # Check max results
             if count >= max_results:
                 break
             
+            # Every file in a directory shares its priority; looked up on the first match
+            priority_level = None
+            
             # Process files in this directory
-            for file in files:
+            for entry in files:
                 # Check max results
                 if count >= max_results:
                     break
                 
+                file = entry.name
+                
+                # Check file type first; the suffix test is far cheaper than the
+                # pattern match and rules out most files on typed queries
+                if file_type and not file.lower().endswith(file_type):
+                    continue
+                
                 # Check if file matches pattern
                 file_matches = True
                 if pattern_regex:
-                    try:
-                        file_matches = bool(pattern_regex.search(file))
-                    except Exception:
-                        # Fallback to glob matching
-                        file_matches = fnmatch.fnmatch(file.lower(), name_pattern.lower())
-                elif name_pattern:
-                    file_matches = fnmatch.fnmatch(file.lower(), name_pattern.lower())
-                
-                # Check file type if specified
-                if file_matches and file_type:
-                    file_matches = file.lower().endswith(file_type.lower())
+                    file_matches = bool(pattern_regex.search(file))
+                elif glob_regex:
+                    file_matches = bool(glob_regex.match(file))
                 
                 if file_matches:
-                    file_path = os.path.join(root, file)
+                    file_path = entry.path
                     try:
-                        stat = os.stat(file_path)
+                        stat = entry.stat()
+                        if priority_level is None:
+                            priority_level = self._get_location_priority(root)
                         results.append({
                             "path": file_path,
                             "name": file,
                             "size": stat.st_size,
                             "date_modified": stat.st_mtime,
-                            "is_folder": False,
-                            "priority_level": self._get_location_priority(root)
+                            "priority_level": priority_level
                         })
                         count += 1
                     except Exception as e:
@@ -270,58 +361,150 @@ class SearchNavigator:
         all_results = []
         remaining_results = max_results
         
+        # Tiers searched by this call (system folders only when requested)
+        tiers = [tier for tier in range(1, 6) if tier != 5 or include_system_folders]
+        
+        # Roots of every location searched by this call. Walks don't descend into
+        # another location's root: each is searched on its own, at least as deep, so
+        # on Windows the C:\ walk doesn't rescan the home folder, Desktop or Documents,
+        # and no file is returned twice
+        all_roots = frozenset(
+            os.path.normcase(location)
+            for tier in tiers
+            for location in self.priority_locations[tier]
+        )
+        searched_roots: Set[str] = set()
+        
         # Search through each priority tier
-        for tier in range(1, 6):
-            # Skip system folders (tier 5) if not requested
-            if tier == 5 and not include_system_folders:
-                continue
+        for tier in tiers:
+            # Stop as soon as the higher-priority tiers have produced enough results
+            if remaining_results <= 0:
+                break
                 
             # Set depth based on tier (higher depth for higher priority locations)
             max_depth = 6 - tier  # Tier 1 gets depth 5, Tier 5 gets depth 1
             
+            # Drop locations listed more than once
+            locations = []
             for location in self.priority_locations[tier]:
-                # Skip if we have enough results
-                if remaining_results <= 0:
-                    break
-                    
-                # Search this location
-                tier_results = self.search_location(
-                    location=location,
-                    name_pattern=name_pattern,
-                    file_type=file_type,
-                    max_depth=max_depth,
-                    max_results=remaining_results
-                )
-                
-                # Add results and update remaining count
-                all_results.extend(tier_results)
-                remaining_results -= len(tier_results)
+                root = os.path.normcase(location)
+                if root not in searched_roots:
+                    searched_roots.add(root)
+                    locations.append(location)
+            
+            tier_results = self._search_tier(
+                locations,
+                name_pattern=name_pattern,
+                file_type=file_type,
+                max_depth=max_depth,
+                max_results=remaining_results,
+                skip_dirs=all_roots
+            )
+            
+            # Add results and update remaining count
+            all_results.extend(tier_results)
+            remaining_results -= len(tier_results)
         
-        # Sort results by priority level (lower is better)
-        all_results.sort(key=lambda x: (x.get("priority_level", 999), -x.get("date_modified", 0)))
+        # Sort results by priority level (lower is better), newest first within a level.
+        # Two stable sorts with C-level itemgetter keys avoid a Python call per row
+        all_results.sort(key=itemgetter("date_modified"), reverse=True)
+        all_results.sort(key=itemgetter("priority_level"))
         
         return all_results[:max_results]
     
-    def _walk_max_depth(self, path: str, max_depth: int) -> Generator[Tuple[str, List[str], List[str]], None, None]:
+    def _search_tier(self,
+                     locations: List[str],
+                     name_pattern: Optional[str],
+                     file_type: Optional[str],
+                     max_depth: int,
+                     max_results: int,
+                     skip_dirs: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search all locations of one priority tier, concurrently when there are several.
+        
+        Directory walking is dominated by filesystem latency, and os.scandir releases
+        the GIL, so locations are searched in parallel threads. Once enough results
+        are in, searches that haven't started yet are cancelled.
+        
+        Args:
+            locations: Locations belonging to the tier
+            name_pattern: Pattern to match filenames against
+            file_type: File extension to filter by (without the dot)
+            max_depth: Maximum folder depth to search
+            max_results: Maximum number of results to return
+            skip_dirs: Normalized directories the walks shouldn't descend into
+            
+        Returns:
+            List of dictionaries with file information
+        """
+        search_args = dict(name_pattern=name_pattern, file_type=file_type,
+                           max_depth=max_depth, max_results=max_results,
+                           skip_dirs=skip_dirs)
+        
+        if len(locations) <= 1:
+            return [result for location in locations
+                    for result in self.search_location(location=location, **search_args)]
+        
+        tier_results = []
+        with ThreadPoolExecutor(max_workers=min(8, len(locations))) as pool:
+            futures = [pool.submit(self.search_location, location=location, **search_args)
+                       for location in locations]
+            for future in as_completed(futures):
+                try:
+                    tier_results.extend(future.result())
+                except Exception as e:
+                    self.logger.error(f"Error searching priority location: {e}")
+                if len(tier_results) >= max_results:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        
+        return tier_results[:max_results]
+    
+    def _walk_max_depth(self, path: str, max_depth: int,
+                        skip_dirs: Optional[Set[str]] = None) -> Generator[Tuple[str, List[os.DirEntry], List[os.DirEntry]], None, None]:
         """
-        Walk a directory tree up to a maximum depth.
+        Walk a directory tree breadth-first up to a maximum depth using os.scandir.
+        
+        Entry types come from the directory read itself, so splitting folders from
+        files needs no extra stat call. Hidden directories and those listed in
+        ``excluded_dirs`` are never scanned, and symlinked folders are not followed.
         
         Args:
             path: Starting path
             max_depth: Maximum depth to walk
+            skip_dirs: Directories (normalized with os.path.normcase) not to descend into
             
         Yields:
-            Tuples of (dirpath, dirnames, filenames) for each directory up to max_depth
+            Tuples of (dirpath, dir entries, file entries) for each directory up to max_depth
         """
-        path = path.rstrip(os.path.sep)
-        assert os.path.isdir(path)
-        num_sep = path.count(os.path.sep)
-        for root, dirs, files in os.walk(path):
+        queue = deque([(path, 0)])
+        while queue:
+            root, depth = queue.popleft()
+            dirs, files = [], []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                dirs.append(entry)
+                            elif entry.is_file():
+                                files.append(entry)
+                        except OSError:
+                            continue
+            except OSError as e:
+                self.logger.debug(f"Skipping unreadable directory {root}: {e}")
+                continue
+            
             yield root, dirs, files
-            current_depth = root.count(os.path.sep) - num_sep
-            if current_depth >= max_depth:
-                # Clear dirs to prevent going deeper
-                dirs.clear()
+            
+            if depth < max_depth:
+                for entry in dirs:
+                    if entry.name.startswith('.') or entry.name in self.excluded_dirs:
+                        continue
+                    if skip_dirs and os.path.normcase(entry.path) in skip_dirs:
+                        continue
+                    queue.append((entry.path, depth + 1))
     
     def _get_location_priority(self, path: str) -> int:
         """
@@ -333,11 +516,8 @@ class SearchNavigator:
         Returns:
             Priority level (1-5, lower is better)
         """
-        for tier, locations in self.priority_locations.items():
-            for location in locations:
-                if path.startswith(location):
-                    return tier
-        return 999  # Unknown location gets lowest priority
+        # Unknown locations get the lowest priority (999)
+        return _priority_for_directory(os.path.normcase(path), self._priority_prefixes)
     
     def find_similar_locations(self, partial_path: str) -> List[str]:
         """
@@ -356,19 +536,20 @@ class SearchNavigator:
         partial_path_lower = partial_path.lower()
         
         # Search in all priority locations
-        for tier in range(1, 6):
-            for location in self.priority_locations[tier]:
-                if partial_path_lower in location.lower():
-                    matches.append(location)
-                
-                # Check immediate subdirectories too
-                try:
-                    for item in os.listdir(location):
-                        item_path = os.path.join(location, item)
-                        if os.path.isdir(item_path) and partial_path_lower in item_path.lower():
-                            matches.append(item_path)
-                except Exception:
-                    pass
+        for location, location_lower in self._priority_lower:
+            if partial_path_lower in location_lower:
+                matches.append(location)
+            
+            # Check immediate subdirectories too; listings are cached until the
+            # location's modification time changes
+            try:
+                subfolders = fs_ops.list_folders(location)
+            except OSError:
+                continue
+            for item in subfolders:
+                item_path = os.path.join(location, item)
+                if partial_path_lower in item_path.lower():
+                    matches.append(item_path)
         
         return matches
 
@@ -7,7 +7,11 @@ Handles creating and managing user sessions.
 import os
 import json
 from uuid import uuid4
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# Absolute session file path -> (st_mtime_ns, cookies) for sessions already read,
+# so repeated loads of an unchanged file skip the read and JSON parse
+_session_cache: Dict[str, Tuple[int, Dict[str, str]]] = {}
 
 
 def create_session_file(filepath: str = "cookies.json") -> Dict[str, str]:
@@ -43,12 +47,21 @@ def load_session(filepath: str = "cookies.json") -> Dict[str, str]:
         Dictionary containing session information
     """
     try:
-        if os.path.exists(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
-                cookies = json.load(f)
-            return cookies
-        else:
-            return create_session_file(filepath)
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return create_session_file(filepath)
+    
+    cache_key = os.path.abspath(filepath)
+    cached = _session_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return dict(cached[1])
+    
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            cookies = json.load(f)
     except Exception as e:
         print(f"Error loading session: {e}")
-        return create_session_file(filepath) 
\ No newline at end of file
+        return create_session_file(filepath)
+    
+    _session_cache[cache_key] = (mtime_ns, cookies)
+    return dict(cookies)
@@ -6,6 +6,8 @@ Handles background voice input (to be integrated after core text features).
 TODO: Migrate this to /core/speech.py and integrate with PyQt6 UI in the future.
 """
 
+import time
+
 import speech_recognition as sr
 from PyQt6.QtCore import QThread, pyqtSignal
 
@@ -25,13 +27,33 @@ class SpeechRecognitionThread(QThread):
                 # Adjust for ambient noise
                 self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
 
-                # Listen for speech
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+                # Listen for speech, waiting up to 5 seconds for it to start. The wait
+                # is split into short slices so a stop() request is noticed promptly
+                audio = None
+                deadline = time.monotonic() + 5
+                while audio is None:
+                    if not self.is_running:
+                        return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise sr.WaitTimeoutError(
+                            "listening timed out while waiting for phrase to start"
+                        )
+                    try:
+                        audio = self.recognizer.listen(
+                            source, timeout=min(0.5, remaining), phrase_time_limit=10
+                        )
+                    except sr.WaitTimeoutError:
+                        continue
+
+            if not self.is_running:
+                return
 
-                # Convert speech to text
-                text = self.recognizer.recognize_google(audio)
+            # Convert speech to text
+            text = self.recognizer.recognize_google(audio)
 
-                # Emit signal with recognized text
+            # Emit signal with recognized text, unless stopped in the meantime
+            if self.is_running:
                 self.text_recognized.emit(text)
 
         except sr.WaitTimeoutError:
@@ -47,5 +69,8 @@ class SpeechRecognitionThread(QThread):
 
     def stop(self):
         """Stop the speech recognition"""
+        # Only ask run() to stop: it checks the flag between steps and releases the
+        # microphone itself, rather than being killed mid-call. This returns at once,
+        # so the GUI thread never blocks on a phrase or a recognition request; use
+        # the finished signal to know when the thread has exited
         self.is_running = False
-        self.terminate()  # This will terminate the thread
@@ -1,6 +1,12 @@
+import atexit
+import logging
 import os
 import sqlite3
-from typing import Any, List, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 APPDATA = os.getenv("APPDATA") or os.path.expanduser("~/.config")
 DB_DIR = os.path.join(APPDATA, "WorkBuddy")
@@ -10,14 +16,33 @@ if not os.path.exists(DB_DIR):
     os.makedirs(DB_DIR)
 
 
+# One connection shared by every helper instead of reconnecting per call; the lock
+# serializes access from the UI, scheduler and search threads
+_CONN = sqlite3.connect(DB_PATH, check_same_thread=False)
+_LOCK = threading.RLock()
+# WAL with synchronous=NORMAL avoids an fsync on most commits
+_CONN.execute("PRAGMA journal_mode=WAL")
+_CONN.execute("PRAGMA synchronous=NORMAL")
+_CONN.execute("PRAGMA temp_store=MEMORY")
+_CONN.execute("PRAGMA cache_size=-8000")
+atexit.register(_CONN.close)
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get a connection to the persistent WorkBuddy database."""
-    return sqlite3.connect(DB_PATH)
+    """Get the shared connection to the persistent WorkBuddy database."""
+    return _CONN
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """Use the shared connection under the lock, committing on success and rolling back on error."""
+    with _LOCK, _CONN:
+        yield _CONN
 
 
 def init_db() -> None:
     """Initialize the database tables if they do not exist."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute(
             """
@@ -49,6 +74,17 @@ def init_db() -> None:
             )
             """
         )
+        # Indexes matching the list queries' filters and ordering, so they read rows
+        # in order instead of scanning and sorting the whole table
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reminders_pending ON reminders(remind_at) WHERE is_done = 0"
+        )
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notes_created ON notes(created_at DESC)"
+        )
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notifications_shown ON notifications(shown_at DESC)"
+        )
         conn.commit()
 
 
@@ -58,7 +94,7 @@ init_db()
 # Reminder functions
 def add_reminder(message: str, remind_at: str) -> int:
     """Add a new reminder. Returns the reminder ID."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute(
             "INSERT INTO reminders (message, remind_at) VALUES (?, ?)",
@@ -68,9 +104,23 @@ def add_reminder(message: str, remind_at: str) -> int:
         return c.lastrowid
 
 
+def add_reminders(reminders: List[Tuple[str, str]]) -> List[int]:
+    """Add several (message, remind_at) reminders in one transaction. Returns their IDs."""
+    with _transaction() as conn:
+        c = conn.cursor()
+        reminder_ids = []
+        for message, remind_at in reminders:
+            c.execute(
+                "INSERT INTO reminders (message, remind_at) VALUES (?, ?)",
+                (message, remind_at),
+            )
+            reminder_ids.append(c.lastrowid)
+        return reminder_ids
+
+
 def get_pending_reminders() -> List[Tuple[int, str, str]]:
     """Get all pending (not done) reminders."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute(
             "SELECT id, message, remind_at FROM reminders WHERE is_done = 0 ORDER BY remind_at ASC"
@@ -78,17 +128,42 @@ def get_pending_reminders() -> List[Tuple[int, str, str]]:
         return c.fetchall()
 
 
+def get_due_reminders(now: str) -> List[Tuple[int, str]]:
+    """Get pending reminders due at or before the given ISO timestamp."""
+    with _transaction() as conn:
+        c = conn.cursor()
+        # julianday() normalises both "YYYY-MM-DD HH:MM:SS" and ISO "T" separated values
+        c.execute(
+            "SELECT id, message FROM reminders WHERE is_done = 0 AND julianday(remind_at) <= julianday(?) ORDER BY remind_at ASC",
+            (now,),
+        )
+        return c.fetchall()
+
+
 def mark_reminder_done(reminder_id: int) -> None:
     """Mark a reminder as done."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute("UPDATE reminders SET is_done = 1 WHERE id = ?", (reminder_id,))
         conn.commit()
 
 
+def mark_reminders_done(reminder_ids: List[int]) -> None:
+    """Mark several reminders as done in a single transaction."""
+    if not reminder_ids:
+        return
+    with _transaction() as conn:
+        c = conn.cursor()
+        c.executemany(
+            "UPDATE reminders SET is_done = 1 WHERE id = ?",
+            [(reminder_id,) for reminder_id in reminder_ids],
+        )
+        conn.commit()
+
+
 def get_all_reminders() -> list[tuple[int, str, str, int]]:
     """Get all reminders, including completed ones, with status."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute(
             "SELECT id, message, remind_at, is_done FROM reminders ORDER BY remind_at ASC"
@@ -96,59 +171,75 @@ def get_all_reminders() -> list[tuple[int, str, str, int]]:
         return c.fetchall()
 
 
-def update_reminder(reminder_id: int, new_message: str, new_remind_at: str) -> None:
-    """Update the message and/or time of a reminder."""
-    print(
-        f"[Storage] update_reminder called with id={reminder_id}, new_message={new_message}, new_remind_at={new_remind_at}"
-    )
-    with get_connection() as conn:
+def update_reminder(
+    reminder_id: int, new_message: str, new_remind_at: str, reset_done: bool = False
+) -> None:
+    """Update the message and/or time of a reminder.
+
+    With reset_done, a reminder that already fired or was cancelled becomes pending
+    again, so it fires at the new time.
+    """
+    with _transaction() as conn:
         c = conn.cursor()
-        c.execute(
-            "UPDATE reminders SET message = ?, remind_at = ? WHERE id = ?",
-            (new_message, new_remind_at, reminder_id),
-        )
-        print(f"[Storage] update_reminder rows affected: {c.rowcount}")
-        conn.commit()
-        # Fetch and print the updated row for verification
-        c.execute(
-            "SELECT id, message, remind_at FROM reminders WHERE id = ?", (reminder_id,)
+        if reset_done:
+            c.execute(
+                "UPDATE reminders SET message = ?, remind_at = ?, is_done = 0 WHERE id = ?",
+                (new_message, new_remind_at, reminder_id),
+            )
+        else:
+            c.execute(
+                "UPDATE reminders SET message = ?, remind_at = ? WHERE id = ?",
+                (new_message, new_remind_at, reminder_id),
+            )
+        logger.debug(
+            "update_reminder id=%s new_message=%s new_remind_at=%s rows affected: %s",
+            reminder_id,
+            new_message,
+            new_remind_at,
+            c.rowcount,
         )
-        updated = c.fetchone()
-        print(f"[Storage] update_reminder row after update: {updated}")
 
 
-def get_all_reminders_with_status() -> list[dict]:
-    """Get all reminders with their status as a string."""
-    with get_connection() as conn:
+def get_all_reminders_with_status() -> List[sqlite3.Row]:
+    """Get all reminders with their status as a string.
+
+    Rows can be read by column name (row["status"]) or unpacked like tuples.
+    """
+    with _transaction() as conn:
         c = conn.cursor()
+        c.row_factory = sqlite3.Row
         c.execute(
-            "SELECT id, message, remind_at, is_done FROM reminders ORDER BY remind_at ASC"
+            """
+            SELECT id, message, remind_at,
+                   CASE is_done WHEN 0 THEN 'Pending' ELSE 'Done' END AS status
+            FROM reminders ORDER BY remind_at ASC
+            """
         )
-        rows = c.fetchall()
-        return [
-            {
-                "id": row[0],
-                "message": row[1],
-                "remind_at": row[2],
-                "status": "Pending" if row[3] == 0 else "Done",
-            }
-            for row in rows
-        ]
+        return c.fetchall()
 
 
 # Notes functions
 def add_note(content: str) -> int:
     """Add a new note. Returns the note ID."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute("INSERT INTO notes (content) VALUES (?)", (content,))
         conn.commit()
         return c.lastrowid
 
 
+def add_notes(contents: List[str]) -> None:
+    """Add several notes in one transaction."""
+    with _transaction() as conn:
+        conn.executemany(
+            "INSERT INTO notes (content) VALUES (?)",
+            [(content,) for content in contents],
+        )
+
+
 def get_notes() -> List[Tuple[int, str, str]]:
     """Get all notes."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute("SELECT id, content, created_at FROM notes ORDER BY created_at DESC")
         return c.fetchall()
@@ -157,7 +248,7 @@ def get_notes() -> List[Tuple[int, str, str]]:
 # Notification history functions
 def add_notification(title: str, message: str) -> int:
     """Add a notification to the history. Returns the notification ID."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute(
             "INSERT INTO notifications (title, message) VALUES (?, ?)",
@@ -167,9 +258,18 @@ def add_notification(title: str, message: str) -> int:
         return c.lastrowid
 
 
+def add_notifications(notifications: List[Tuple[str, str]]) -> None:
+    """Add several (title, message) notifications to the history in one transaction."""
+    with _transaction() as conn:
+        conn.executemany(
+            "INSERT INTO notifications (title, message) VALUES (?, ?)",
+            notifications,
+        )
+
+
 def get_notifications() -> List[Tuple[int, str, str, str]]:
     """Get all notifications from history."""
-    with get_connection() as conn:
+    with _transaction() as conn:
         c = conn.cursor()
         c.execute(
             "SELECT id, title, message, shown_at FROM notifications ORDER BY shown_at DESC"
@@ -4,19 +4,39 @@ Google Calendar integration module for WorkBuddy (Jarvis Assistant).
 Handles authentication, CRUD operations for calendar events, notifications for upcoming meetings, and daily meeting summaries.
 """
 
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import Iterator, List, Dict, Optional, Any, Tuple
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import os
-import pickle
+import threading
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config")
 CREDENTIALS_PATH = os.path.join(CONFIG_DIR, "credentials.json")
-TOKEN_PATH = os.path.join(CONFIG_DIR, "token.pickle")
+TOKEN_PATH = os.path.join(CONFIG_DIR, "token.json")
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
+# Most calls the Calendar API accepts in one batch request
+BATCH_LIMIT = 50
+# Partial response masks: only the event fields WorkBuddy reads
+_EVENT_FIELDS = (
+    "id,summary,description,location,status,start,end,htmlLink,hangoutLink,"
+    "attendees(email,responseStatus)"
+)
+EVENT_LIST_FIELDS = f"items({_EVENT_FIELDS}),nextPageToken"
+# Incremental sync also needs recurrence rules and the token for the next sync
+EVENT_SYNC_FIELDS = f"items({_EVENT_FIELDS},recurrence),nextPageToken,nextSyncToken"
+
+# Credentials and API client shared by all instances, so creating another
+# GoogleCalendarIntegration doesn't reread the token or rebuild the service
+_creds: Optional[Credentials] = None
+_service = None
+# Serializes token loading and the OAuth flow, so concurrent callers can't run two
+# flows or write the token file at the same time
+_AUTH_LOCK = threading.Lock()
 
 
 class GoogleCalendarIntegration:
@@ -24,29 +44,63 @@ class GoogleCalendarIntegration:
     Integration class for interacting with Google Calendar API.
     """
 
+    __slots__ = ("creds", "service", "tz", "_sync_token", "_synced_events")
+
     def __init__(self) -> None:
         """
         Initialize the GoogleCalendarIntegration, handle authentication and token loading.
         """
-        self.creds = None
-        self.service = None
+        self.creds = _creds
+        self.service = _service
+        # Local mirror of the calendar kept current by sync_events
+        self._sync_token: Optional[str] = None
+        self._synced_events: Dict[str, Dict[str, Any]] = {}
+        tz_name = os.environ.get("TIMEZONE", "UTC")
+        try:
+            self.tz = ZoneInfo(tz_name)
+        except ZoneInfoNotFoundError:
+            # Windows has no system zone database; it comes from the tzdata package
+            print(
+                f"Google Calendar warning: unknown time zone {tz_name!r}, using UTC. "
+                "Check TIMEZONE and that the tzdata package is installed."
+            )
+            self.tz = timezone.utc
         if not os.path.exists(CONFIG_DIR):
             os.makedirs(CONFIG_DIR)
-        self.authenticate()
+        if self.service is None:
+            self.authenticate()
 
     def authenticate(self) -> bool:
         """
         Authenticate with Google Calendar using OAuth2. Store and refresh tokens as needed.
 
+        Only one thread authenticates at a time. Callers that waited, and instances
+        created later, reuse the service it built; the client library refreshes the
+        access token itself when it expires.
+
         Returns:
             bool: True if authentication is successful, False otherwise.
         """
+        with _AUTH_LOCK:
+            if _service is None and not self._authenticate_locked():
+                return False
+            self.creds, self.service = _creds, _service
+            return True
+
+    def _authenticate_locked(self) -> bool:
+        """
+        Load or obtain credentials and build the shared service. Call with
+        _AUTH_LOCK held.
+
+        Returns:
+            bool: True if authentication is successful, False otherwise.
+        """
+        global _creds, _service
         try:
             creds = None
             # Load token if it exists
             if os.path.exists(TOKEN_PATH):
-                with open(TOKEN_PATH, "rb") as token:
-                    creds = pickle.load(token)
+                creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
             # If no valid creds, do OAuth flow
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
@@ -59,44 +113,50 @@ class GoogleCalendarIntegration:
                         CREDENTIALS_PATH, SCOPES
                     )
                     creds = flow.run_local_server(port=0)
-                # Save the token
-                with open(TOKEN_PATH, "wb") as token:
-                    pickle.dump(creds, token)
-            self.creds = creds
-            self.service = build("calendar", "v3", credentials=creds)
+                # Save the token as JSON, readable only by the user
+                fd = os.open(TOKEN_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w", encoding="utf-8") as token:
+                    token.write(creds.to_json())
+            # The discovery document ships with the client library, so no HTTP fetch
+            _service = build("calendar", "v3", credentials=creds, static_discovery=True)
+            _creds = creds
             return True
         except Exception as e:
             print(f"Google Calendar authentication error: {e}")
             return False
 
-    def get_events(
+    def iter_events(
         self, start: Optional[datetime] = None, end: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Fetch calendar events within a given time window.
+        Yield calendar events within a given time window, in start time order.
+
+        Further result pages are requested only when the caller consumes past the
+        current one, so callers that stop early (e.g. at the first event after a given
+        time) don't fetch the rest.
 
         Args:
             start (Optional[datetime]): Start of the time window. Defaults to today.
             end (Optional[datetime]): End of the time window. Defaults to end of today.
 
-        Returns:
-            List[Dict[str, Any]]: List of event details.
+        Yields:
+            Dict[str, Any]: Event details.
+
+        Raises:
+            HttpError: If a page of events cannot be fetched.
         """
         if not self.service:
             if not self.authenticate():
-                return []
-        try:
-            from datetime import timedelta
-            import pytz
-
-            tz = pytz.timezone(os.environ.get("TIMEZONE", "UTC"))
-            now = datetime.now(tz)
-            if not start:
-                start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            if not end:
-                end = start + timedelta(days=1)
-            time_min = start.isoformat()
-            time_max = end.isoformat()
+                return
+        now = datetime.now(self.tz)
+        if not start:
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if not end:
+            end = start + timedelta(days=1)
+        time_min = start.isoformat()
+        time_max = end.isoformat()
+        page_token = None
+        while True:
             events_result = (
                 self.service.events()
                 .list(
@@ -105,11 +165,31 @@ class GoogleCalendarIntegration:
                     timeMax=time_max,
                     singleEvents=True,
                     orderBy="startTime",
+                    fields=EVENT_LIST_FIELDS,
+                    pageToken=page_token,
                 )
                 .execute()
             )
-            events = events_result.get("items", [])
-            return events
+            yield from events_result.get("items", [])
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
+
+    def get_events(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch calendar events within a given time window.
+
+        Args:
+            start (Optional[datetime]): Start of the time window. Defaults to today.
+            end (Optional[datetime]): End of the time window. Defaults to end of today.
+
+        Returns:
+            List[Dict[str, Any]]: List of event details.
+        """
+        try:
+            return list(self.iter_events(start, end))
         except HttpError as error:
             print(f"An error occurred: {error}")
             return []
@@ -117,6 +197,68 @@ class GoogleCalendarIntegration:
             print(f"Google Calendar get_events error: {e}")
             return []
 
+    def sync_events(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Bring the local mirror of the calendar up to date and return it.
+
+        The first call lists every event and keeps the sync token of the last page.
+        Later calls send that token and receive only the events changed since, so a
+        poll costs O(changes) instead of O(events). When Google expires the token
+        (HTTP 410 Gone) the mirror is rebuilt with a full sync.
+
+        Recurring events are kept as one entry with their recurrence rules, since
+        they can only be expanded into instances within a time window.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Events keyed by event ID.
+        """
+        if not self.service:
+            if not self.authenticate():
+                return {}
+        try:
+            try:
+                self._apply_event_changes()
+            except HttpError as error:
+                if error.resp.status != 410:
+                    raise
+                self._sync_token = None
+                self._synced_events.clear()
+                self._apply_event_changes()
+        except Exception as e:
+            print(f"Google Calendar sync_events error: {e}")
+        return dict(self._synced_events)
+
+    def _apply_event_changes(self) -> None:
+        """
+        Fetch the events changed since the last sync (all events without a sync
+        token) and apply them to the local mirror.
+
+        Raises:
+            HttpError: If a page of changes cannot be fetched.
+        """
+        page_token = None
+        while True:
+            events_result = (
+                self.service.events()
+                .list(
+                    calendarId="primary",
+                    syncToken=self._sync_token,
+                    pageToken=page_token,
+                    fields=EVENT_SYNC_FIELDS,
+                )
+                .execute()
+            )
+            for event in events_result.get("items", []):
+                if event.get("status") == "cancelled":
+                    self._synced_events.pop(event["id"], None)
+                else:
+                    self._synced_events[event["id"]] = event
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                # Only the last page carries the token for the next sync
+                self._sync_token = events_result.get("nextSyncToken")
+                break
+
     def add_event(
         self,
         summary: str,
@@ -142,15 +284,7 @@ class GoogleCalendarIntegration:
             if not self.authenticate():
                 return {"error": "Authentication failed"}
         try:
-            event = {
-                "summary": summary,
-                "start": {"dateTime": start.isoformat()},
-                "end": {"dateTime": end.isoformat()},
-            }
-            if description:
-                event["description"] = description
-            if attendees:
-                event["attendees"] = [{"email": email} for email in attendees]
+            event = self._event_body(summary, start, end, description, attendees)
             created_event = (
                 self.service.events().insert(calendarId="primary", body=event).execute()
             )
@@ -174,15 +308,10 @@ class GoogleCalendarIntegration:
             if not self.authenticate():
                 return {"error": "Authentication failed"}
         try:
-            event = (
-                self.service.events()
-                .get(calendarId="primary", eventId=event_id)
-                .execute()
-            )
-            event.update(updates)
+            # A patch changes only the given fields, so the event needn't be fetched first
             updated_event = (
                 self.service.events()
-                .update(calendarId="primary", eventId=event_id, body=event)
+                .patch(calendarId="primary", eventId=event_id, body=updates)
                 .execute()
             )
             return updated_event
@@ -212,6 +341,159 @@ class GoogleCalendarIntegration:
             print(f"Google Calendar delete_event error: {e}")
             return False
 
+    @staticmethod
+    def _event_body(
+        summary: str,
+        start: datetime,
+        end: datetime,
+        description: Optional[str] = None,
+        attendees: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the API resource for a new event.
+
+        Args:
+            summary (str): Event title.
+            start (datetime): Event start time.
+            end (datetime): Event end time.
+            description (Optional[str]): Event description.
+            attendees (Optional[List[str]]): List of attendee emails.
+
+        Returns:
+            Dict[str, Any]: Event resource for events().insert.
+        """
+        event = {
+            "summary": summary,
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": end.isoformat()},
+        }
+        if description:
+            event["description"] = description
+        if attendees:
+            event["attendees"] = [{"email": email} for email in attendees]
+        return event
+
+    def _execute_batch(self, calls: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+        """
+        Execute API calls in batch HTTP requests of up to BATCH_LIMIT calls each.
+
+        Args:
+            calls (List[Any]): Unexecuted API requests, e.g. events().insert(...).
+
+        Returns:
+            List[Tuple[Any, Optional[Exception]]]: (response, exception) for each call,
+            in the order of the calls.
+        """
+        results: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(calls)
+
+        def callback(
+            request_id: str, response: Any, exception: Optional[Exception]
+        ) -> None:
+            results[int(request_id)] = (response, exception)
+
+        for offset in range(0, len(calls), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for index, call in enumerate(calls[offset : offset + BATCH_LIMIT], offset):
+                batch.add(call, request_id=str(index))
+            batch.execute()
+        return results
+
+    def add_events_bulk(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add several events with batched requests instead of one round trip per event.
+
+        Args:
+            events (List[Dict[str, Any]]): Keyword arguments of add_event for each event
+                (summary, start, end and optionally description and attendees).
+
+        Returns:
+            List[Dict[str, Any]]: Created event details or error info, in input order.
+        """
+        if not self.service:
+            if not self.authenticate():
+                return [{"error": "Authentication failed"}] * len(events)
+        try:
+            calls = [
+                self.service.events().insert(
+                    calendarId="primary", body=self._event_body(**event)
+                )
+                for event in events
+            ]
+            return [
+                {"error": str(exception)} if exception else response
+                for response, exception in self._execute_batch(calls)
+            ]
+        except Exception as e:
+            print(f"Google Calendar add_events_bulk error: {e}")
+            return [{"error": str(e)}] * len(events)
+
+    def update_events_bulk(
+        self, updates: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Update several events with batched requests.
+
+        Each update is sent as a patch, like update_event does.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): Fields to update, keyed by event ID.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Updated event details or error info, keyed by
+            event ID.
+        """
+        if not self.service:
+            if not self.authenticate():
+                return {
+                    event_id: {"error": "Authentication failed"} for event_id in updates
+                }
+        try:
+            event_ids = list(updates)
+            calls = [
+                self.service.events().patch(
+                    calendarId="primary", eventId=event_id, body=updates[event_id]
+                )
+                for event_id in event_ids
+            ]
+            return {
+                event_id: {"error": str(exception)} if exception else response
+                for event_id, (response, exception) in zip(
+                    event_ids, self._execute_batch(calls)
+                )
+            }
+        except Exception as e:
+            print(f"Google Calendar update_events_bulk error: {e}")
+            return {event_id: {"error": str(e)} for event_id in updates}
+
+    def delete_events_bulk(self, event_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several events with batched requests.
+
+        Args:
+            event_ids (List[str]): The IDs of the events to delete.
+
+        Returns:
+            Dict[str, bool]: True for each deleted event, False otherwise, keyed by
+            event ID.
+        """
+        if not self.service:
+            if not self.authenticate():
+                return {event_id: False for event_id in event_ids}
+        try:
+            calls = [
+                self.service.events().delete(calendarId="primary", eventId=event_id)
+                for event_id in event_ids
+            ]
+            return {
+                event_id: exception is None
+                for event_id, (_, exception) in zip(
+                    event_ids, self._execute_batch(calls)
+                )
+            }
+        except Exception as e:
+            print(f"Google Calendar delete_events_bulk error: {e}")
+            return {event_id: False for event_id in event_ids}
+
     def notify_upcoming_meetings(self, minutes_before: int = 10) -> None:
         """
         Notify the user before each meeting today, defaulting to 10 minutes before start.
@@ -228,7 +510,13 @@ class GoogleCalendarIntegration:
         Returns:
             str: Human-readable summary of today's meetings.
         """
-        pass
+        events = self.get_events()
+        if not events:
+            return "No meetings scheduled for today."
+        plural = "s" if len(events) != 1 else ""
+        parts = [f"You have {len(events)} meeting{plural} today:"]
+        parts.extend(f"\n- {self.describe_event(event)}" for event in events)
+        return "".join(parts)
 
     def describe_event(self, event: Dict[str, Any]) -> str:
         """
@@ -240,4 +528,29 @@ class GoogleCalendarIntegration:
         Returns:
             str: Description of the event.
         """
-        pass
+        parts = [event.get("summary") or "Untitled event"]
+        start = event.get("start", {})
+        end = event.get("end", {})
+        if "dateTime" in start:
+            # fromisoformat only accepts a "Z" suffix from Python 3.11 on
+            start_time = datetime.fromisoformat(
+                start["dateTime"].replace("Z", "+00:00")
+            ).astimezone(self.tz)
+            parts.append(f" at {start_time:%H:%M}")
+            if "dateTime" in end:
+                end_time = datetime.fromisoformat(
+                    end["dateTime"].replace("Z", "+00:00")
+                ).astimezone(self.tz)
+                parts.append(f"-{end_time:%H:%M}")
+        else:
+            parts.append(" (all day)")
+        attendees = event.get("attendees") or []
+        if attendees:
+            parts.append(
+                f" with {len(attendees)} attendee{'s' if len(attendees) != 1 else ''}"
+            )
+        if event.get("location"):
+            parts.append(f" in {event['location']}")
+        if event.get("hangoutLink"):
+            parts.append(f" (video call: {event['hangoutLink']})")
+        return "".join(parts)
@@ -4,18 +4,167 @@ GitHub integration module for WorkBuddy (Jarvis Assistant).
 Handles authentication, polling, and data access for assigned issues, PRs, and reviews.
 """
 
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import datetime
-from typing import Any, Dict, List, Optional, Union
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Optional faster JSON parser for the larger payloads (repos, events)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Per-repo requests are I/O bound, so they are fanned out over a small pool. The
+# pool size caps the requests in flight to stay clear of GitHub's secondary rate limit.
+MAX_CONCURRENT_REQUESTS = 5
+_REQUEST_POOL = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="github"
+)
+
+# Responses younger than this are served without a request; older ones are
+# revalidated with their ETag
+RESPONSE_CACHE_TTL_SECONDS = 60
+RESPONSE_CACHE_MAX_ENTRIES = 256
+# ETag, parsed body, monotonic fetch time and next page URL of a cached response
+_CacheEntry = Tuple[Optional[str], Any, float, Optional[str]]
+
+# The repository list changes rarely; get_recent_activity and get_pull_requests
+# reuse it for this long instead of fetching it again
+REPOS_CACHE_TTL_SECONDS = 300
+
+# Formatted repository keys and the REST fields they come from. Every repository
+# object has all of these fields (null when unset), so they are read in one call.
+_REPO_KEYS = (
+    "id",
+    "name",
+    "full_name",
+    "description",
+    "language",
+    "stars",
+    "forks",
+    "updated_at",
+    "url",
+)
+_repo_fields = itemgetter(
+    "id",
+    "name",
+    "full_name",
+    "description",
+    "language",
+    "stargazers_count",
+    "forks_count",
+    "updated_at",
+    "html_url",
+)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+# REST pull request states and the GraphQL states they cover
+_GRAPHQL_PR_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": ["OPEN", "CLOSED", "MERGED"],
+}
+# Pull requests of up to 100 repositories (by node ID) in one request, newest first
+# like the REST endpoint, at most $first per repository
+_PULL_REQUESTS_QUERY = """
+query($ids: [ID!]!, $states: [PullRequestState!], $first: Int!) {
+  nodes(ids: $ids) {
+    ... on Repository {
+      nameWithOwner
+      pullRequests(
+        states: $states, first: $first, orderBy: {field: CREATED_AT, direction: DESC}
+      ) {
+        nodes { number title state author { login } createdAt updatedAt url }
+      }
+    }
+  }
+}
+"""
+
+# Pull requests fetched per repository by default: one REST page, and the most a
+# GraphQL connection returns at once
+MAX_PULL_REQUESTS_PER_REPO = 100
+
+# Secondary rate limit answers (403/429 with Retry-After) are retried this many
+# times. Calls can run on the UI thread, so an answer asking for a longer wait than
+# MAX_RETRY_WAIT_SECONDS is returned as is instead of blocking
+RATE_LIMIT_RETRIES = 2
+MAX_RETRY_WAIT_SECONDS = 10
+
+
+def _rate_limit_resource(url: str) -> str:
+    """Return the GitHub rate limit resource a REST URL counts against."""
+    return "search" if "/search/" in url else "core"
+
+
+def _format_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a repository event for get_recent_activity.
+
+    GitHub always sends the actor and repo objects, so they are indexed directly and
+    only a malformed event takes the exception path.
+    """
+    event_type = event.get("type") or ""
+    if event_type.endswith("Event"):
+        event_type = event_type[:-5]
+    try:
+        actor = event["actor"]["login"]
+    except (KeyError, TypeError):
+        actor = None
+    try:
+        repo = event["repo"]["name"]
+    except (KeyError, TypeError):
+        repo = None
+    return {
+        "type": event_type,
+        "actor": actor,
+        "repo": repo,
+        "created_at": event.get("created_at"),
+    }
+
 
 class GitHubIntegration:
     """Integration class for interacting with the GitHub API."""
 
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "headers",
+        "session",
+        "user",
+        "_user_info",
+        "_configured",
+        "repos",
+        "_repo_refs",
+        "notifications",
+        "_repos_limit",
+        "_repos_fetched_at",
+        "_etag_cache",
+        "_cache_lock",
+        "_rate_limited_until",
+    )
+
     def __init__(self) -> None:
         """Initialize the GitHubIntegration with environment token and headers."""
         self.api_key: str = os.environ.get("GITHUB_TOKEN", "")
@@ -23,71 +172,287 @@ class GitHubIntegration:
         self.headers: Dict[str, str] = {
             "Authorization": f"token {self.api_key}",
             "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "WorkBuddy/1.0",
         }
+        # One pooled session keeps TCP/TLS connections alive across calls and
+        # retries transient failures with backoff. The headers are set on it once;
+        # requests only pass the headers that vary, such as If-None-Match.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS * 2,
+            # Only transient server errors are retried here; rate limit answers
+            # (403/429 with Retry-After) are left to _get, which caps the wait
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
         self.user: Optional[Dict[str, Any]] = None
+        # Derived from self.user once per successful init_connection, since the UI
+        # polls get_user_info and every public method checks is_configured
+        self._user_info: Optional[Dict[str, Any]] = None
+        self._configured: bool = False
+        # Formatted repositories (as get_repos returns them) and their
+        # (full name, node ID) pairs for the per-repo requests; the raw API objects
+        # aren't kept
         self.repos: List[Dict[str, Any]] = []
+        self._repo_refs: List[Tuple[str, Optional[str]]] = []
+        # The limit self.repos was fetched with, and when (monotonic)
+        self._repos_limit: int = 0
+        self._repos_fetched_at: float = 0.0
         self.notifications: List[Dict[str, Any]] = []
+        # (url, params) -> cached response, least recently used first
+        self._etag_cache: "OrderedDict[Tuple[str, Tuple], _CacheEntry]" = OrderedDict()
+        # Guards _etag_cache, which the request pool threads share
+        self._cache_lock = threading.Lock()
+        # Rate limit resource ("core", "search") -> epoch time until which its quota
+        # is used up (X-RateLimit-Reset)
+        self._rate_limited_until: Dict[str, float] = {}
         if self.api_key:
             self.init_connection()
 
     def init_connection(self) -> bool:
         """Initialize connection to GitHub API and load basic user info."""
         try:
-            response = requests.get(f"{self.base_url}/user", headers=self.headers)
+            response = self._get(f"{self.base_url}/user")
             if response.status_code == 200:
-                self.user = response.json()
+                self.user = _json_loads(response.content)
+                self._user_info = {
+                    "username": self.user.get("login"),
+                    "name": self.user.get("name"),
+                    "avatar_url": self.user.get("avatar_url"),
+                    "public_repos": self.user.get("public_repos"),
+                    "followers": self.user.get("followers"),
+                    "following": self.user.get("following"),
+                }
+                self._configured = bool(self.api_key)
                 return True
             return False
         except Exception as e:
             print(f"GitHub connection error: {str(e)}")
             return False
 
+    def _get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """GET a URL, honoring GitHub's rate limit headers.
+
+        Secondary rate limit answers are retried after their Retry-After delay plus an
+        exponential backoff with jitter, unless the delay exceeds MAX_RETRY_WAIT_SECONDS,
+        in which case the rate limited response is returned. The X-RateLimit headers of the final response
+        record when a rate limit is used up; the search API has its own quota, so
+        limits are tracked per resource.
+
+        Args:
+            url (str): The API URL to fetch.
+            headers (Optional[Dict[str, str]], optional): Extra request headers. Defaults to None.
+            params (Optional[Dict[str, Any]], optional): Query parameters. Defaults to None.
+
+        Returns:
+            requests.Response: The final response.
+        """
+        response = self.session.get(url, headers=headers, params=params)
+        for attempt in range(RATE_LIMIT_RETRIES):
+            if response.status_code not in (403, 429):
+                break
+            try:
+                retry_after = int(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                break
+            wait = max(retry_after, 2**attempt) + random.random()
+            if wait > MAX_RETRY_WAIT_SECONDS:
+                break
+            time.sleep(wait)
+            response = self.session.get(url, headers=headers, params=params)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            resource = response.headers.get(
+                "X-RateLimit-Resource", _rate_limit_resource(url)
+            )
+            try:
+                reset = float(response.headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                pass
+            else:
+                self._rate_limited_until[resource] = reset
+        return response
+
+    def _conditional_get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Any]:
+        """GET a JSON resource through the response cache.
+
+        Args:
+            url (str): The API URL to fetch.
+            params (Optional[Dict[str, Any]], optional): Query parameters. Defaults to None.
+
+        Returns:
+            Tuple[int, Any]: The status code (200 for a cache hit) and the parsed JSON body,
+            or None as the body when the request failed.
+        """
+        status_code, data, _ = self._conditional_get_page(url, params)
+        return status_code, data
+
+    def _conditional_get_page(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Any, Optional[str]]:
+        """GET one page of a JSON resource through the response cache.
+
+        Bodies fetched within RESPONSE_CACHE_TTL_SECONDS are returned without a
+        request. Older ones are revalidated with If-None-Match, and a 304 Not Modified
+        answer (which doesn't count against the rate limit) reuses the cached body.
+        While the primary rate limit is used up, stale bodies are served as they are.
+
+        Args:
+            url (str): The API URL to fetch.
+            params (Optional[Dict[str, Any]], optional): Query parameters. Defaults to None.
+
+        Returns:
+            Tuple[int, Any, Optional[str]]: The status code (200 for a cache hit), the
+            parsed JSON body (None when the request failed) and the URL of the next page
+            from the Link header, if any.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
+        now = time.monotonic()
+        if cached and now - cached[2] < RESPONSE_CACHE_TTL_SECONDS:
+            return 200, cached[1], cached[3]
+        if time.time() < self._rate_limited_until.get(_rate_limit_resource(url), 0.0):
+            # Requests would only be rejected until the limit resets
+            return (200, cached[1], cached[3]) if cached else (403, None, None)
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        response = self._get(url, headers=headers, params=params)
+        if response.status_code == 304 and cached:
+            etag, data, _, next_url = cached
+        elif response.status_code == 200:
+            data = _json_loads(response.content)
+            etag = response.headers.get("ETag")
+            next_url = response.links.get("next", {}).get("url")
+        else:
+            return response.status_code, None, None
+        with self._cache_lock:
+            self._etag_cache[key] = (etag, data, now, next_url)
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._etag_cache.popitem(last=False)
+        return 200, data, next_url
+
+    def _iter_paginated(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the items of a list endpoint, following the Link rel="next" pages.
+
+        Pages are fetched only as items are consumed, so a caller that stops early
+        (e.g. with itertools.islice) never requests the remaining pages.
+
+        Args:
+            url (str): The API URL of the first page.
+            params (Optional[Dict[str, Any]], optional): Query parameters for the first
+                page; the next links already carry them. Defaults to None.
+
+        Yields:
+            Dict[str, Any]: The items of each page in order.
+
+        Raises:
+            requests.HTTPError: If a page cannot be fetched.
+        """
+        while url:
+            status_code, page, url = self._conditional_get_page(url, params)
+            if status_code != 200:
+                raise requests.HTTPError(f"GitHub API error: {status_code}")
+            params = None
+            yield from page
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GitHub GraphQL query.
+
+        Args:
+            query (str): The GraphQL query.
+            variables (Dict[str, Any]): Values for the query variables.
+
+        Returns:
+            Dict[str, Any]: The "data" member of the response.
+
+        Raises:
+            requests.HTTPError: If the request fails or the query returns errors.
+        """
+        response = self.session.post(
+            GRAPHQL_URL, json={"query": query, "variables": variables}
+        )
+        if response.status_code != 200:
+            raise requests.HTTPError(f"GitHub GraphQL error: {response.status_code}")
+        body = _json_loads(response.content)
+        if body.get("errors"):
+            raise requests.HTTPError(
+                f"GitHub GraphQL error: {body['errors'][0].get('message')}"
+            )
+        return body["data"]
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses so the next calls hit the API."""
+        with self._cache_lock:
+            self._etag_cache.clear()
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and its connections."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubIntegration":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def is_configured(self) -> bool:
         """Check if GitHub integration is configured with a valid token."""
-        return bool(self.api_key and self.user is not None)
+        return self._configured
 
     def get_user_info(self) -> Union[Dict[str, Any], Dict[str, str]]:
         """Get basic user information from GitHub."""
         if not self.is_configured():
             return {"error": "GitHub integration not configured"}
-        return {
-            "username": self.user.get("login"),
-            "name": self.user.get("name"),
-            "avatar_url": self.user.get("avatar_url"),
-            "public_repos": self.user.get("public_repos"),
-            "followers": self.user.get("followers"),
-            "following": self.user.get("following"),
-        }
+        # A shallow copy keeps callers from changing the cached info
+        return dict(self._user_info)
 
     def get_notifications(
-        self, all: bool = False
+        self, all: bool = False, limit: int = 50
     ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
         """Get GitHub notifications for the authenticated user."""
         if not self.is_configured():
             return {"error": "GitHub integration not configured"}
         try:
-            params = {"all": "true"} if all else {}
-            response = requests.get(
-                f"{self.base_url}/notifications", headers=self.headers, params=params
+            params = {"per_page": min(limit, 50)}
+            if all:
+                params["all"] = "true"
+            self.notifications = list(
+                itertools.islice(
+                    self._iter_paginated(f"{self.base_url}/notifications", params),
+                    limit,
+                )
             )
-            if response.status_code == 200:
-                self.notifications = response.json()
-                formatted = []
-                for notification in self.notifications:
-                    formatted.append(
-                        {
-                            "id": notification.get("id"),
-                            "repository": notification.get("repository", {}).get(
-                                "name"
-                            ),
-                            "subject": notification.get("subject", {}).get("title"),
-                            "type": notification.get("subject", {}).get("type"),
-                            "reason": notification.get("reason"),
-                            "updated_at": notification.get("updated_at"),
-                        }
-                    )
-                return formatted
-            return {"error": f"GitHub API error: {response.status_code}"}
+            return [
+                {
+                    "id": notification.get("id"),
+                    "repository": notification.get("repository", {}).get("name"),
+                    # The subject dict is looked up once and reused for "type"
+                    "subject": (subject := notification.get("subject", {})).get("title"),
+                    "type": subject.get("type"),
+                    "reason": notification.get("reason"),
+                    "updated_at": notification.get("updated_at"),
+                }
+                for notification in self.notifications
+            ]
         except Exception as e:
             print(f"GitHub error: {str(e)}")
             return {"error": str(e)}
@@ -97,112 +462,211 @@ class GitHubIntegration:
         if not self.is_configured():
             return {"error": "GitHub integration not configured"}
         try:
-            params = {"per_page": limit, "sort": "updated"}
-            response = requests.get(
-                f"{self.base_url}/user/repos", headers=self.headers, params=params
-            )
-            if response.status_code == 200:
-                self.repos = response.json()
-                formatted = []
-                for repo in self.repos:
-                    formatted.append(
-                        {
-                            "id": repo.get("id"),
-                            "name": repo.get("name"),
-                            "full_name": repo.get("full_name"),
-                            "description": repo.get("description"),
-                            "language": repo.get("language"),
-                            "stars": repo.get("stargazers_count"),
-                            "forks": repo.get("forks_count"),
-                            "updated_at": repo.get("updated_at"),
-                            "url": repo.get("html_url"),
-                        }
+            if not self._repos_cached(limit):
+                params = {"per_page": min(limit, 100), "sort": "updated"}
+                repos = list(
+                    itertools.islice(
+                        self._iter_paginated(f"{self.base_url}/user/repos", params),
+                        limit,
                     )
-                return formatted
-            return {"error": f"GitHub API error: {response.status_code}"}
+                )
+                self.repos = [dict(zip(_REPO_KEYS, _repo_fields(r))) for r in repos]
+                self._repo_refs = [(r["full_name"], r.get("node_id")) for r in repos]
+                self._repos_limit = limit
+                self._repos_fetched_at = time.monotonic()
+            return self.repos[:limit]
         except Exception as e:
             print(f"GitHub error: {str(e)}")
             return {"error": str(e)}
 
+    def _repos_cached(self, limit: int) -> bool:
+        """Check whether self.repos is recent and was fetched with at least `limit`."""
+        return (
+            limit <= self._repos_limit
+            and time.monotonic() - self._repos_fetched_at < REPOS_CACHE_TTL_SECONDS
+        )
+
+    def _ensure_repos(self, limit: int) -> List[Tuple[str, Optional[str]]]:
+        """Return (full name, node ID) of the `limit` most recently updated repositories.
+
+        Args:
+            limit (int): Number of repositories needed.
+
+        Returns:
+            List[Tuple[str, Optional[str]]]: The repositories, fetched again only when
+            the cached list is too old or too short.
+        """
+        if not self._repos_cached(limit):
+            self.get_repos(limit=limit)
+        return self._repo_refs[:limit]
+
     def get_recent_activity(
         self, limit: int = 10
     ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
         """Get recent activity from user's repositories."""
         if not self.is_configured():
             return {"error": "GitHub integration not configured"}
-        if not self.repos:
-            self.get_repos(limit=20)
+        repo_names = [name for name, _ in self._ensure_repos(5)]
         try:
-            all_events = []
-            for repo in self.repos[:5]:
-                repo_name = repo.get("full_name")
-                response = requests.get(
-                    f"{self.base_url}/repos/{repo_name}/events", headers=self.headers
-                )
-                if response.status_code == 200:
-                    events = response.json()
-                    all_events.extend(events)
-            all_events.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-            formatted = []
-            for event in all_events[:limit]:
-                event_type = event.get("type", "").replace("Event", "")
-                actor = event.get("actor", {}).get("login")
-                repo = event.get("repo", {}).get("name")
-                created_at = event.get("created_at")
-                formatted.append(
-                    {
-                        "type": event_type,
-                        "actor": actor,
-                        "repo": repo,
-                        "created_at": created_at,
-                    }
-                )
-            return formatted
+            def fetch_events(repo_name: str) -> List[Dict[str, Any]]:
+                # A failing repository is skipped rather than failing the others
+                try:
+                    status_code, events = self._conditional_get(
+                        f"{self.base_url}/repos/{repo_name}/events"
+                    )
+                except requests.RequestException as e:
+                    print(f"GitHub error fetching events for {repo_name}: {e}")
+                    return []
+                return events if status_code == 200 else []
+
+            all_events = itertools.chain.from_iterable(
+                _REQUEST_POOL.map(fetch_events, repo_names)
+            )
+            # Only the newest `limit` events are needed, so skip sorting the rest
+            latest = heapq.nlargest(limit, all_events, key=itemgetter("created_at"))
+            return [_format_event(event) for event in latest]
         except Exception as e:
             print(f"GitHub error: {str(e)}")
             return {"error": str(e)}
 
     def get_pull_requests(
-        self, state: str = "open"
+        self, state: str = "open", limit_per_repo: int = MAX_PULL_REQUESTS_PER_REPO
     ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
-        """Get pull requests from all user's repositories."""
+        """Get pull requests from all user's repositories.
+
+        The pull requests come from one GraphQL query when every repository has a
+        node ID, and from per-repository REST requests otherwise. Both paths return
+        the newest limit_per_repo pull requests of each repository, so the result
+        doesn't depend on which one ran. GraphQL returns at most 100 per repository,
+        so the limit is capped at MAX_PULL_REQUESTS_PER_REPO.
+
+        Args:
+            state (str, optional): The state of the pull requests to fetch. Defaults to "open".
+            limit_per_repo (int, optional): Most pull requests returned per repository,
+                newest first. Defaults to MAX_PULL_REQUESTS_PER_REPO.
+
+        Returns:
+            Union[List[Dict[str, Any]], Dict[str, str]]: Formatted pull requests, or an
+            error dict.
+        """
         if not self.is_configured():
             return {"error": "GitHub integration not configured"}
-        if not self.repos:
-            self.get_repos(limit=100)  # Fetch more repos if possible
+        repos = self._ensure_repos(100)  # Fetch more repos if possible
+        limit_per_repo = max(1, min(limit_per_repo, MAX_PULL_REQUESTS_PER_REPO))
         try:
-            all_prs = []
-            for repo in self.repos:
-                repo_name = repo.get("full_name")
-                response = requests.get(
-                    f"{self.base_url}/repos/{repo_name}/pulls",
-                    headers=self.headers,
-                    params={"state": state},
-                )
-                if response.status_code == 200:
-                    prs = response.json()
-                    for pr in prs:
-                        pr["repo"] = repo_name
-                    all_prs.extend(prs)
-            formatted = []
-            for pr in all_prs:
-                formatted.append(
-                    {
-                        "number": pr.get("number"),
-                        "title": pr.get("title"),
-                        "state": pr.get("state"),
-                        "user": pr.get("user", {}).get("login"),
-                        "repo": pr.get("repo"),
-                        "created_at": pr.get("created_at"),
-                        "updated_at": pr.get("updated_at"),
-                        "url": pr.get("html_url"),
-                    }
-                )
-            return formatted
+            has_node_ids = all(node_id for _, node_id in repos)
+            if state in _GRAPHQL_PR_STATES and has_node_ids:
+                try:
+                    return self._pull_requests_graphql(repos, state, limit_per_repo)
+                except requests.RequestException as e:
+                    print(f"GitHub GraphQL error, falling back to REST: {e}")
+            return self._pull_requests_rest(repos, state, limit_per_repo)
         except Exception as e:
             print(f"GitHub error: {str(e)}")
             return {"error": str(e)}
 
+    def _pull_requests_graphql(
+        self,
+        repos: List[Tuple[str, Optional[str]]],
+        state: str,
+        limit_per_repo: int = MAX_PULL_REQUESTS_PER_REPO,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the pull requests of many repositories with a single GraphQL query.
+
+        Args:
+            repos (List[Tuple[str, Optional[str]]]): (full name, node ID) of at most
+                100 repositories, each with a node ID.
+            state (str): "open", "closed" or "all".
+            limit_per_repo (int, optional): Most pull requests kept per repository, at
+                most 100. Defaults to MAX_PULL_REQUESTS_PER_REPO.
+
+        Returns:
+            List[Dict[str, Any]]: Formatted pull requests, newest first per repository.
+
+        Raises:
+            requests.RequestException: If the query fails.
+        """
+        if not repos:
+            return []
+        data = self._graphql(
+            _PULL_REQUESTS_QUERY,
+            {
+                "ids": [node_id for _, node_id in repos],
+                "states": _GRAPHQL_PR_STATES[state],
+                "first": limit_per_repo,
+            },
+        )
+        return [
+            {
+                "number": pr["number"],
+                "title": pr["title"],
+                # REST reports merged pull requests as closed
+                "state": "open" if pr["state"] == "OPEN" else "closed",
+                "user": (pr.get("author") or {}).get("login"),
+                "repo": repo["nameWithOwner"],
+                "created_at": pr["createdAt"],
+                "updated_at": pr["updatedAt"],
+                "url": pr["url"],
+            }
+            for repo in data["nodes"]
+            if repo
+            for pr in repo["pullRequests"]["nodes"]
+        ]
+
+    def _pull_requests_rest(
+        self,
+        repos: List[Tuple[str, Optional[str]]],
+        state: str,
+        limit_per_repo: int = MAX_PULL_REQUESTS_PER_REPO,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the pull requests of each repository with concurrent REST requests.
+
+        Pages are only followed until limit_per_repo pull requests are in, so with the
+        default limit each repository costs a single request.
+
+        Args:
+            repos (List[Tuple[str, Optional[str]]]): (full name, node ID) of the
+                repositories.
+            state (str): The state of the pull requests to fetch.
+            limit_per_repo (int, optional): Most pull requests kept per repository.
+                Defaults to MAX_PULL_REQUESTS_PER_REPO.
+
+        Returns:
+            List[Dict[str, Any]]: Formatted pull requests, newest first per repository.
+        """
+        def fetch_prs(repo_name: str) -> List[Dict[str, Any]]:
+            try:
+                return list(
+                    itertools.islice(
+                        self._iter_paginated(
+                            f"{self.base_url}/repos/{repo_name}/pulls",
+                            params={"state": state, "per_page": min(limit_per_repo, 100)},
+                        ),
+                        limit_per_repo,
+                    )
+                )
+            except requests.RequestException as e:
+                print(f"GitHub error fetching pull requests for {repo_name}: {e}")
+                return []
+
+        repo_names = [name for name, _ in repos]
+        return [
+            {
+                "number": pr.get("number"),
+                "title": pr.get("title"),
+                "state": pr.get("state"),
+                "user": pr.get("user", {}).get("login"),
+                "repo": repo_name,
+                "created_at": pr.get("created_at"),
+                "updated_at": pr.get("updated_at"),
+                "url": pr.get("html_url"),
+            }
+            for repo_name, prs in zip(
+                repo_names, _REQUEST_POOL.map(fetch_prs, repo_names)
+            )
+            for pr in prs
+        ]
+
     def get_pull_requests_for_repo(
         self, repo_full_name: str, state: str = "open", user: Optional[str] = None
     ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -219,13 +683,17 @@ class GitHubIntegration:
         if not self.is_configured():
             return {"error": "GitHub integration not configured"}
         try:
-            response = requests.get(
-                f"{self.base_url}/repos/{repo_full_name}/pulls",
-                headers=self.headers,
-                params={"state": state},
-            )
-            if response.status_code == 200:
-                prs = response.json()
+            prs = None
+            if user:
+                # Let GitHub filter server-side; fall back to filtering the listing
+                prs = self._search_pull_requests(repo_full_name, state, user)
+            if prs is None:
+                status_code, prs = self._conditional_get(
+                    f"{self.base_url}/repos/{repo_full_name}/pulls",
+                    params={"state": state},
+                )
+                if status_code != 200:
+                    return {"error": f"GitHub API error: {status_code}"}
                 if user:
                     user_lc = user.lower()
                     prs = [
@@ -241,38 +709,73 @@ class GitHubIntegration:
                             for r in pr.get("requested_reviewers", [])
                         )
                     ]
-                formatted = []
-                for pr in prs:
-                    formatted.append(
-                        {
-                            "number": pr.get("number"),
-                            "title": pr.get("title"),
-                            "state": pr.get("state"),
-                            "user": pr.get("user", {}).get("login"),
-                            "repo": repo_full_name,
-                            "created_at": pr.get("created_at"),
-                            "updated_at": pr.get("updated_at"),
-                            "url": pr.get("html_url"),
-                        }
-                    )
-                return formatted
-            return {"error": f"GitHub API error: {response.status_code}"}
+            return [
+                {
+                    "number": pr.get("number"),
+                    "title": pr.get("title"),
+                    "state": pr.get("state"),
+                    "user": pr.get("user", {}).get("login"),
+                    "repo": repo_full_name,
+                    "created_at": pr.get("created_at"),
+                    "updated_at": pr.get("updated_at"),
+                    "url": pr.get("html_url"),
+                }
+                for pr in prs
+            ]
         except Exception as e:
             print(f"GitHub error: {str(e)}")
             return {"error": str(e)}
 
+    def _search_pull_requests(
+        self, repo_full_name: str, state: str, user: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Find a repository's pull requests involving a user with the search API.
+
+        Matches pull requests the user authored, is assigned to or has a pending
+        review request on, like the filter in get_pull_requests_for_repo.
+
+        Args:
+            repo_full_name (str): The full name of the repository (e.g., 'owner/repo').
+            state (str): "open", "closed" or "all".
+            user (str): The GitHub login to match.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Up to 100 matching issues-API items (which
+            carry the same fields as pull request listings), or None if the search
+            can't be used (unknown state, search rate limit or other failure).
+        """
+        if state not in ("open", "closed", "all"):
+            return None
+        query = f"repo:{repo_full_name} is:pr"
+        if state != "all":
+            query += f" state:{state}"
+        query += f" (author:{user} OR assignee:{user} OR review-requested:{user})"
+        try:
+            status_code, data = self._conditional_get(
+                f"{self.base_url}/search/issues",
+                params={"q": query, "advanced_search": "true", "per_page": 100},
+            )
+        except requests.RequestException as e:
+            print(f"GitHub search error: {e}")
+            return None
+        if status_code != 200:
+            return None
+        return data.get("items", [])
+
     def generate_summary(self) -> str:
         """Generate a human-readable summary of GitHub activity."""
         if not self.is_configured():
             return "GitHub integration is not configured. Please set up your GitHub token to enable this feature."
         try:
-            notifications = self.get_notifications()
+            # The two requests are independent, so fetch notifications in the background
+            notifications_future = _REQUEST_POOL.submit(self.get_notifications)
+            repos = self.get_repos(limit=5)
+            notifications = notifications_future.result()
             notification_count = (
                 0
                 if isinstance(notifications, dict) and "error" in notifications
                 else len(notifications)
             )
-            repos = self.get_repos(limit=5)
             repo_count = (
                 0 if isinstance(repos, dict) and "error" in repos else len(repos)
             )
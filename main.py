@@ -5,16 +5,9 @@ Launches the PyQt6 overlay chat window and system tray integration.
 """
 
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.overlay import OverlayWindow
-from ui.tray import WorkBuddyTray
-from core.hotkeys import hotkey_manager
 import logging
 import os
 import getpass
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 def setup_logging() -> None:
@@ -37,6 +30,18 @@ def main() -> None:
     """
     Start the WorkBuddy assistant application with overlay and tray.
     """
+    # Imported here so logging is configured before Qt and the UI modules load.
+    # .env is loaded first, since some of those modules read settings on import.
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    from PyQt6.QtWidgets import QApplication
+    from ui.overlay import OverlayWindow
+    from ui.tray import WorkBuddyTray
+    from core.hotkeys import hotkey_manager
+    from core.scheduler import get_scheduler
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
@@ -44,6 +49,9 @@ def main() -> None:
     tray = WorkBuddyTray(overlay)
     tray.show()
 
+    # Start the reminder and GitHub polling jobs
+    get_scheduler()
+
     # Register the global hotkey for showing/hiding the overlay
     hotkey_manager.register_show_hide(overlay.toggle_visibility)
     logging.info("Global hotkey registered: Alt+Shift+W to show/hide WorkBuddy")
@@ -10,15 +10,27 @@ import os
 import sys
 import subprocess
 import platform
-import importlib.util
+import pkgutil
+import runpy
 import time
 
+# Required pip packages and the top-level module each one installs
+REQUIRED_PACKAGES = {
+    "PyQt6": "PyQt6",
+    "requests": "requests",
+    "SpeechRecognition": "speech_recognition",
+    "pyttsx3": "pyttsx3",
+    "psutil": "psutil",
+    "pywin32": "win32api",
+    "pillow": "PIL",
+}
+
 
 def check_python_version():
-    """Check if Python version is compatible (3.8+)"""
+    """Check if Python version is compatible (3.9+)"""
     major, minor = sys.version_info[:2]
-    if major < 3 or (major == 3 and minor < 8):
-        print(f"Error: Python 3.8+ is required. You have Python {major}.{minor}")
+    if major < 3 or (major == 3 and minor < 9):
+        print(f"Error: Python 3.9+ is required. You have Python {major}.{minor}")
         return False
     return True
 
@@ -53,22 +65,14 @@ def check_dependencies():
     """Check if all required packages are installed"""
     print("Checking dependencies...")
 
-    required_packages = [
-        "PyQt6",
-        "requests",
-        "SpeechRecognition",
-        "pyttsx3",
-        "psutil",
-        "pywin32",
-        "pillow",
+    # One scan of sys.path instead of an import system lookup per package
+    installed = {module.name for module in pkgutil.iter_modules()}
+    missing_packages = [
+        package
+        for package, module_name in REQUIRED_PACKAGES.items()
+        if module_name not in installed
     ]
 
-    missing_packages = []
-
-    for package in required_packages:
-        if importlib.util.find_spec(package.lower()) is None:
-            missing_packages.append(package)
-
     if missing_packages:
         print(f"Missing packages: {', '.join(missing_packages)}")
         return False
@@ -112,13 +116,22 @@ def setup_api_key():
 def create_app_icon():
     """Create application icon if it doesn't exist"""
     print("\nCreating application icon...")
+    icon_script = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "assets", "create_icon.py"
+    )
     try:
-        icon_script = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "create_icon.py"
-        )
-        subprocess.check_call([sys.executable, icon_script])
+        # Run the script in this interpreter rather than starting another one
+        runpy.run_path(icon_script, run_name="__main__")
         return True
-    except subprocess.CalledProcessError as e:
+    except ImportError:
+        # Packages installed moments ago may only be importable in a fresh process
+        try:
+            subprocess.check_call([sys.executable, icon_script])
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"Error creating icon: {e}")
+            return False
+    except Exception as e:
         print(f"Error creating icon: {e}")
         return False
 
@@ -130,14 +143,25 @@ def configure_startup():
 
     if choice == "y":
         try:
-            startup_script = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "setup_startup.py"
-            )
-            subprocess.check_call([sys.executable, startup_script, "--enable"])
+            import setup_startup
+        except ImportError:
+            # pywin32 installed moments ago may only be importable in a fresh process
+            try:
+                startup_script = os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)), "setup_startup.py"
+                )
+                subprocess.check_call([sys.executable, startup_script, "--enable"])
+                return True
+            except subprocess.CalledProcessError as e:
+                print(f"Error configuring startup: {e}")
+                return False
+        shortcut_created = setup_startup.setup_startup_shortcut()
+        registry_set = setup_startup.setup_registry_startup()
+        if shortcut_created or registry_set:
+            print("WorkBuddy will now run when you log into Windows.")
             return True
-        except subprocess.CalledProcessError as e:
-            print(f"Error configuring startup: {e}")
-            return False
+        print("Failed to set up auto-start. Please try running as administrator.")
+        return False
     else:
         print("Skipping startup configuration.")
         return True
@@ -13,6 +13,25 @@ import pythoncom
 import win32com.client
 from pathlib import Path
 
+RUN_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+# WScript.Shell COM object, created on first use and shared by the shortcut helpers
+_shell = None
+
+
+def _get_shell():
+    """Return the shared WScript.Shell object, initializing COM only once"""
+    global _shell
+    if _shell is None:
+        pythoncom.CoInitialize()  # Initialize COM
+        _shell = win32com.client.Dispatch("WScript.Shell")
+    return _shell
+
+
+def _open_run_key():
+    """Open the current user's Run key for writing; use it in a with block so it is closed"""
+    return winreg.OpenKey(winreg.HKEY_CURRENT_USER, RUN_KEY_PATH, 0, winreg.KEY_SET_VALUE)
+
 
 def setup_startup_shortcut():
     """Create a shortcut in the Windows Startup folder to launch the application on system startup"""
@@ -38,9 +57,7 @@ def setup_startup_shortcut():
         shortcut_path = os.path.join(startup_folder, "WorkBuddy.lnk")
 
         # Create the shortcut
-        pythoncom.CoInitialize()  # Initialize COM
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortCut(shortcut_path)
+        shortcut = _get_shell().CreateShortCut(shortcut_path)
         shortcut.Targetpath = python_exe
         shortcut.Arguments = f'"{script_path}"'
         shortcut.WorkingDirectory = os.path.dirname(script_path)
@@ -67,17 +84,9 @@ def setup_registry_startup():
         # Create the command to run
         cmd = f'"{python_exe}" "{script_path}"'
 
-        # Open the registry key
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Run",
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-
-        # Set the value
-        winreg.SetValueEx(key, "WorkBuddy", 0, winreg.REG_SZ, cmd)
-        winreg.CloseKey(key)
+        # Set the value; the key is closed when the block exits, even on error
+        with _open_run_key() as key:
+            winreg.SetValueEx(key, "WorkBuddy", 0, winreg.REG_SZ, cmd)
 
         print("Registry startup entry created")
         return True
@@ -105,20 +114,12 @@ def remove_from_startup():
             print(f"Removed startup shortcut: {shortcut_path}")
 
         # Remove registry entry
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Run",
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-
-        try:
-            winreg.DeleteValue(key, "WorkBuddy")
-            print("Removed registry startup entry")
-        except FileNotFoundError:
-            pass  # Registry key didn't exist
-
-        winreg.CloseKey(key)
+        with _open_run_key() as key:
+            try:
+                winreg.DeleteValue(key, "WorkBuddy")
+                print("Removed registry startup entry")
+            except FileNotFoundError:
+                pass  # Registry key didn't exist
 
         return True
     except Exception as e:
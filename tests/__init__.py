@@ -3,48 +3,26 @@ Tests package for WorkBuddy.
 This package contains all unit and integration tests.
 """
 
-# Import test modules
-try:
-    from tests.test_file_search import main as test_file_search
-except ImportError:
-    pass
-
-try:
-    from tests.test_search_navigator import main as test_search_navigator
-except ImportError:
-    pass
-
-try:
-    from tests.test_everything_search import main as test_everything_search
-except ImportError:
-    pass
-
-try:
-    from tests.test_search_for_file import main as test_search_for_file
-except ImportError:
-    pass
-
-try:
-    from tests.test_compare_search_methods import main as test_compare_search_methods
-except ImportError:
-    pass
-
-try:
-    from tests.test_real_file_search import main as test_real_file_search
-except ImportError:
-    pass
-
-try:
-    from tests.test_file_search_controller import main as test_file_search_controller
-except ImportError:
-    pass
-
-try:
-    from tests.test_command import run_shell_command
-except ImportError:
-    pass
-
-try:
-    from tests.test_calendar_manual import test_calendar_operations
-except ImportError:
-    pass
+import importlib
+
+# (module, attribute, exported name) for each test entry point
+_TEST_ENTRY_POINTS = [
+    ("tests.test_file_search", "main", "test_file_search"),
+    ("tests.test_search_navigator", "main", "test_search_navigator"),
+    ("tests.test_everything_search", "main", "test_everything_search"),
+    ("tests.test_search_for_file", "main", "test_search_for_file"),
+    ("tests.test_compare_search_methods", "main", "test_compare_search_methods"),
+    ("tests.test_real_file_search", "main", "test_real_file_search"),
+    ("tests.test_file_search_controller", "main", "test_file_search_controller"),
+    ("tests.test_command", "run_shell_command", "run_shell_command"),
+    ("tests.test_calendar_manual", "test_calendar_operations", "test_calendar_operations"),
+]
+
+# Import test modules, skipping any whose dependencies are unavailable
+for _module_name, _attr, _alias in _TEST_ENTRY_POINTS:
+    try:
+        globals()[_alias] = getattr(importlib.import_module(_module_name), _attr)
+    except (ImportError, AttributeError):
+        pass
+
+del _module_name, _attr, _alias
@@ -8,7 +8,14 @@ import platform
 import shlex
 import subprocess
 import time
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=128)
+def _split_command(command: str) -> Tuple[str, ...]:
+    """Tokenize a command string once; a tuple so the cached value can't be changed."""
+    return tuple(shlex.split(command))
 
 
 def run_shell_command(
@@ -42,7 +49,7 @@ def run_shell_command(
             )
         else:
             # On Unix, prefer shlex.split() + shell=False
-            cmd_list = shlex.split(command)
+            cmd_list = list(_split_command(command))
             result = subprocess.run(
                 cmd_list,
                 shell=False,
@@ -12,14 +12,19 @@ from pathlib import Path
 from core.ai_file_search_handler import file_search_handler
 from core.everything_search import search_engine
 
+# Stable for the whole run, so probe them once at import
+_SDK_AVAILABLE = search_engine.available
+_HOME = str(Path.home())
+_DESKTOP = os.path.join(_HOME, "Desktop")
+_DESKTOP_EXISTS = os.path.exists(_DESKTOP)
+
 def test_direct_operations():
     """Test direct file/folder operations."""
     print("\n=== Testing Direct File Operations ===\n")
     
     # Test home directory operations
-    home_dir = str(Path.home())
-    print(f"Listing folders in {home_dir}:")
-    result = file_search_handler.process_ai_command({"action": "list_folders", "directory": home_dir})
+    print(f"Listing folders in {_HOME}:")
+    result = file_search_handler.process_ai_command({"action": "list_folders", "directory": _HOME})
     folders = result.get("folders", [])
     print(f"Found {len(folders)} folders")
     for i, folder in enumerate(folders[:5], 1):
@@ -28,10 +33,9 @@ def test_direct_operations():
         print(f"...and {len(folders) - 5} more folders")
     
     # Test desktop operations
-    desktop = os.path.join(home_dir, "Desktop")
-    if os.path.exists(desktop):
+    if _DESKTOP_EXISTS:
         print(f"\nListing files on Desktop:")
-        result = file_search_handler.process_ai_command({"action": "list_files", "directory": desktop, "pattern": "*.*"})
+        result = file_search_handler.process_ai_command({"action": "list_files", "directory": _DESKTOP, "pattern": "*.*"})
         files = result.get("files", [])
         print(f"Found {len(files)} files")
         for i, file in enumerate(files[:5], 1):
@@ -40,7 +44,7 @@ def test_direct_operations():
             print(f"...and {len(files) - 5} more files")
     
     # Test file existence
-    example_file = os.path.join(desktop, "example.txt")
+    example_file = os.path.join(_DESKTOP, "example.txt")
     print(f"\nChecking if file exists: {example_file}")
     result = file_search_handler.process_ai_command({"action": "file_exists", "path": example_file})
     exists = result.get("exists", False)
@@ -58,9 +62,9 @@ def test_natural_language_search():
         "Find Excel files created last week"
     ]
     
-    for query in queries:
+    responses = file_search_handler.natural_language_search_batch(queries)
+    for query, response in zip(queries, responses):
         print(f"\nQuery: \"{query}\"")
-        response = file_search_handler.natural_language_search(query)
         print("-" * 80)
         print(response)
         print("-" * 80)
@@ -117,7 +121,7 @@ def main():
     args = parser.parse_args()
     
     # Check if Everything SDK is available
-    print(f"Everything SDK available: {search_engine.available}")
+    print(f"Everything SDK available: {_SDK_AVAILABLE}")
     
     if args.query:
         response = file_search_handler.natural_language_search(args.query)
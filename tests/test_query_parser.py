@@ -0,0 +1,39 @@
+"""
+Tests for the natural language query parser shared by the file search adapters.
+"""
+
+import os
+
+import pytest
+
+from core.query_parser import parse_query
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("in /tmp pdf files", {"path": "/tmp", "file_type": "pdf", "query": ""}),
+        ("in ~/Documents report",
+         {"path": os.path.expanduser("~/Documents"), "file_type": None, "query": "report"}),
+        ("notes in /var/log top 5", {"path": "/var/log", "query": "notes", "limit": 5}),
+        ("report in \"/home/me/my docs\" larger than 2 MB",
+         {"path": "/home/me/my docs", "query": "report", "min_size": 2 * 1024**2}),
+        ("budget in 'C:\\Users\\me\\My Documents' .xlsx",
+         {"path": "C:\\Users\\me\\My Documents", "file_type": "xlsx", "query": "budget"}),
+        ("in C:\\Program Files\\App exe files",
+         {"path": "C:\\Program Files\\App", "file_type": "exe", "query": ""}),
+        ("files of type docx limit 500", {"path": None, "file_type": "docx", "query": "", "limit": 100}),
+        ("invoice smaller than 10 KB", {"query": "invoice", "max_size": 10 * 1024}),
+    ],
+)
+def test_parse_query(query, expected):
+    """Each query yields the expected parameters and leftover search text."""
+    params = parse_query(query)
+    for key, value in expected.items():
+        assert params[key] == value, key
+
+
+@pytest.mark.parametrize("query", ["in /tmp pdf files today", "report in ~/Projects last week"])
+def test_parse_query_time_frame_after_path(query):
+    """A time frame after an unquoted path is still recognised."""
+    assert parse_query(query)["modified_after"] is not None
@@ -9,6 +9,12 @@ from typing import Optional, Any
 from core.ai_file_search_handler import file_search_handler
 from core.everything_search import search_engine
 
+# Stable for the whole session, so probe them once instead of on every query
+_SDK_AVAILABLE = search_engine.available
+_HOME = os.path.expanduser("~")
+_DESKTOP = os.path.join(_HOME, "Desktop")
+_DESKTOP_EXISTS = os.path.exists(_DESKTOP)
+
 
 def run_query(query: str) -> None:
     """
@@ -21,10 +27,9 @@ def run_query(query: str) -> None:
     print("-" * 80)
     
     # Print debug info
-    print(f"Everything SDK available: {search_engine.available}")
-    desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-    print(f"Desktop path: {desktop_path}")
-    print(f"Desktop exists: {os.path.exists(desktop_path)}")
+    print(f"Everything SDK available: {_SDK_AVAILABLE}")
+    print(f"Desktop path: {_DESKTOP}")
+    print(f"Desktop exists: {_DESKTOP_EXISTS}")
     
     # Run the search
     result = file_search_handler.natural_language_search(query)
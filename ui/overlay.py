@@ -261,17 +261,12 @@ class RemindersDialog(QDialog):
                 QMessageBox.warning(dlg, "Validation Error", "Message cannot be empty.")
                 return
             try:
-                storage.update_reminder(reminder_id, new_message, new_remind_at)
-                # Reschedule the reminder in APScheduler
-                try:
-                    new_remind_at_dt = dateutil.parser.parse(new_remind_at)
-                    scheduler.reschedule_reminder(
-                        reminder_id, new_message, new_remind_at_dt
-                    )
-                except Exception as sched_err:
-                    logging.error(
-                        f"[Scheduler] Failed to reschedule reminder id={reminder_id}: {sched_err}"
-                    )
+                # Store the new message and time and re-arm the reminder; a failure
+                # here is reported by the error dialog below
+                new_remind_at_dt = dateutil.parser.parse(new_remind_at)
+                scheduler.reschedule_reminder(
+                    reminder_id, new_message, new_remind_at_dt
+                )
                 # Log the edit
                 user = getpass.getuser()
                 logging.info(
@@ -924,7 +919,7 @@ class OverlayWindow(QDialog):
             
             # Get PRs for the confirmed repo
             try:
-                result = scheduler.github_integration.get_pull_requests_for_repo(self.suggested_repo)
+                result = scheduler.get_github_integration().get_pull_requests_for_repo(self.suggested_repo)
                 
                 if isinstance(result, list):
                     if len(result) == 0:
@@ -1240,10 +1235,7 @@ class OverlayWindow(QDialog):
                                 
                             print(f"DEBUG: Found existing reminder: {reminder}")
                             
-                            # Update the reminder in storage and reschedule
-                            print(f"DEBUG: Calling storage.update_reminder({reminder_id}, {new_message}, {formatted_time})")
-                            storage.update_reminder(reminder_id, new_message, formatted_time)
-                            
+                            # Update the reminder in storage and reschedule it
                             print(f"DEBUG: Calling scheduler.reschedule_reminder({reminder_id}, {new_message}, {new_remind_at})")
                             scheduler.reschedule_reminder(reminder_id, new_message, new_remind_at)
                             
@@ -1288,13 +1280,13 @@ class OverlayWindow(QDialog):
                         # Execute the appropriate GitHub API call based on the action
                         result = None
                         if action == "github_notifications":
-                            result = scheduler.github_integration.get_notifications()
+                            result = scheduler.get_github_integration().get_notifications()
                         elif action == "github_prs":
-                            result = scheduler.github_integration.get_pull_requests()
+                            result = scheduler.get_github_integration().get_pull_requests()
                         elif action == "github_repos":
-                            result = scheduler.github_integration.get_repos(limit=20)
+                            result = scheduler.get_github_integration().get_repos(limit=20)
                         elif action == "github_activity":
-                            result = scheduler.github_integration.get_recent_activity()
+                            result = scheduler.get_github_integration().get_recent_activity()
                         elif action == "github_prs_for_repo":
                             repo = response_json.get("repo", "")
                             user = response_json.get("user", None)
@@ -1307,7 +1299,7 @@ class OverlayWindow(QDialog):
                             if '/' not in repo:
                                 # Need to find the full repo name using fuzzy matching
                                 # First get all repos
-                                all_repos = scheduler.github_integration.get_repos(limit=50)
+                                all_repos = scheduler.get_github_integration().get_repos(limit=50)
                                 
                                 if isinstance(all_repos, dict) and "error" in all_repos:
                                     self._append_ai_message(f"Error accessing GitHub repositories: {all_repos['error']}")
@@ -1361,7 +1353,7 @@ class OverlayWindow(QDialog):
                             repo_parts = repo.split('/')
                             if len(repo_parts) == 2:
                                 owner, repo_name = repo_parts
-                                result = scheduler.github_integration.get_pull_requests_for_repo(repo, user=user)
+                                result = scheduler.get_github_integration().get_pull_requests_for_repo(repo, user=user)
                             else:
                                 self._append_ai_message(f"Invalid repository format: {repo}. Please use the format 'owner/repo'.")
                                 return